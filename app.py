@@ -1,5 +1,6 @@
 import os
 import tempfile
+import time
 def _secret_get(path, default=None):
     """Read secrets by trying multiple formats.
     path can be tuple for nested keys, or string for top-level key.
@@ -45,8 +46,9 @@ def _get_gomag_creds():
 import pandas as pd
 import streamlit as st
 
-from src.export_gomag import save_xlsx, to_gomag_dataframe
-from src.gomag_ui import GomagCreds, fetch_categories, import_file
+from src.export_gomag import to_gomag_dataframe, to_xlsx_bytes
+from src.gomag_ui import GomagCreds, GomagSession
+from src.cache import clear_html
 from src.pipeline import scrape_products
 from src.utils import detect_url_column
 
@@ -61,6 +63,59 @@ except Exception:
 
 st.set_page_config(page_title="Gomag Importer", layout="wide")
 
+
+@st.cache_resource(show_spinner=False)
+def _get_gomag_session(base_url: str, email: str, password: str) -> GomagSession:
+    """Logged-in Gomag browser kept across reruns (and user sessions) of this server process."""
+    sess = GomagSession(GomagCreds(base_url=base_url, email=email, password=password))
+    sess.login_once()
+    return sess
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_categories(base_url: str, email: str, _password: str) -> list:
+    # _password: leading underscore keeps it out of the cache key
+    return _get_gomag_session(base_url, email, _password).fetch_categories()
+
+
+_SCRAPE_TTL = 3600
+
+
+@st.cache_resource(show_spinner=False)
+def _scrape_store() -> dict:
+    """url -> (scraped_at, draft), shared across reruns; only successful drafts go in."""
+    return {}
+
+
+def _is_failed_draft(d) -> bool:
+    # errors, 403 blocks and missing source credentials are worth retrying on the next click
+    notes = d.notes or ""
+    return d.title == "(EROARE SCRAPING)" or "blocked=" in notes or "missing creds" in notes
+
+
+def _cached_scrape(urls: list) -> list:
+    store = _scrape_store()
+    now = time.time()
+    # the store is process-wide and lives as long as the server: drop what can no longer be served
+    for u, (scraped_at, _) in list(store.items()):
+        if now - scraped_at >= _SCRAPE_TTL:
+            store.pop(u, None)
+    hits = {u: store[u][1] for u in urls if u in store and now - store[u][0] < _SCRAPE_TTL}
+    missing = list(dict.fromkeys(u for u in urls if u not in hits))
+    if missing:
+        for u, d in zip(missing, scrape_products(missing)):
+            hits[u] = d
+            if not _is_failed_draft(d):
+                store[u] = (now, d)
+    return [hits[u] for u in urls]
+
+
+@st.cache_data(show_spinner=False)
+def _build_xlsx(df: pd.DataFrame) -> bytes:
+    # Streamlit reruns the script on every click; rebuild only when the export changes.
+    return to_xlsx_bytes(df)
+
+
 # =====================
 # Debug artifacts panel (sidebar)
 # =====================
@@ -104,28 +159,28 @@ with st.sidebar:
     st.header("Gomag")
     gomag_enabled = st.checkbox("Activeaza conectare Gomag (Playwright)", value=False)
     if gomag_enabled:
-    try:
-    creds = _get_gomag_creds()
-    if creds is None:
-        raise RuntimeError("missing")
-    st.success("Secrets Gomag incarcate.")
-    except Exception:
-    creds = None
-    st.error("Lipsesc secrets Gomag. Completeaza in Streamlit Cloud -> Settings -> Secrets.")
+        try:
+            creds = _get_gomag_creds()
+            if creds is None:
+                raise RuntimeError("missing")
+            st.success("Secrets Gomag incarcate.")
+        except Exception:
+            creds = None
+            st.error("Lipsesc secrets Gomag. Completeaza in Streamlit Cloud -> Settings -> Secrets.")
     else:
         creds = None
 
-    st.subheader("1) Incarca Excel cu link-uri")
-    uploaded = st.file_uploader("Excel (.xlsx)", type=["xlsx"])
+st.subheader("1) Incarca Excel cu link-uri")
+uploaded = st.file_uploader("Excel (.xlsx)", type=["xlsx"])
 
-    if "drafts" not in st.session_state:
+if "drafts" not in st.session_state:
     st.session_state["drafts"] = []
-    if "df_edit" not in st.session_state:
+if "df_edit" not in st.session_state:
     st.session_state["df_edit"] = None
-    if "categories" not in st.session_state:
+if "categories" not in st.session_state:
     st.session_state["categories"] = []
 
-    if uploaded:
+if uploaded:
     df = pd.read_excel(uploaded)
     url_col = detect_url_column(df.columns)
     if not url_col:
@@ -138,23 +193,28 @@ with st.sidebar:
 
     colA, colB = st.columns([1, 1])
     with colA:
+        refresh = st.checkbox("Reimprospateaza (ignora datele preluate anterior)", value=False)
         if st.button("2) Preia date din link-uri", type="primary"):
+            if refresh:
+                # both layers: parsed drafts and the fetched/rendered HTML they came from
+                _scrape_store().clear()
+                clear_html()
             with st.spinner("Scrape in curs (poate dura)..."):
-                drafts = scrape_products(urls)
+                drafts = _cached_scrape(urls)
             st.session_state["drafts"] = drafts
             st.success(f"Am preluat {len(drafts)} produse.")
     with colB:
         if creds and st.button("Incarca categorii din Gomag"):
             with st.spinner("Citesc categoriile din Gomag..."):
                 try:
-                    cats = fetch_categories(creds)
+                    cats = _cached_categories(creds.base_url, creds.email, creds.password)
                     st.session_state["categories"] = cats
                     st.success(f"Gasite {len(cats)} categorii.")
                 except Exception as e:
                     st.error(f"Eroare la citire categorii: {e}")
 
-    drafts = st.session_state.get("drafts", [])
-    if drafts:
+drafts = st.session_state.get("drafts", [])
+if drafts:
     st.subheader("3) Tabel intermediar (verifica / corecteaza)")
     df_products = pd.DataFrame(drafts)
     st.session_state["df_edit"] = st.data_editor(df_products, use_container_width=True, num_rows="dynamic")
@@ -165,16 +225,16 @@ with st.sidebar:
 
     st.dataframe(gomag_df.head(50), use_container_width=True)
 
-    tmpdir = tempfile.mkdtemp()
-    out_xlsx = os.path.join(tmpdir, "gomag_import.xlsx")
-    save_xlsx(gomag_df, out_xlsx)
-
-    with open(out_xlsx, "rb") as f:
-        st.download_button("Descarca XLSX pentru Gomag", f, file_name="gomag_import.xlsx")
+    xlsx_bytes = _build_xlsx(gomag_df)
+    st.download_button("Descarca XLSX pentru Gomag", xlsx_bytes, file_name="gomag_import.xlsx")
 
     if creds:
         st.subheader("5) Import in Gomag (browser automation)")
         if st.button("Import in Gomag acum", type="primary"):
             with st.spinner("Incarc fisierul si pornesc importul in Gomag..."):
-                msg = import_file(creds, out_xlsx)
+                # upload needs a file on disk
+                out_xlsx = os.path.join(tempfile.mkdtemp(), "gomag_import.xlsx")
+                with open(out_xlsx, "wb") as f:
+                    f.write(xlsx_bytes)
+                msg = _get_gomag_session(creds.base_url, creds.email, creds.password).import_file(out_xlsx)
             st.success(msg)
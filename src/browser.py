@@ -1,26 +1,48 @@
 from __future__ import annotations
 
 import asyncio
+import glob
 import os
+import re
 import subprocess
 import sys
+from urllib.parse import urlsplit
 
 from playwright.async_api import async_playwright
 
+from .cache import get_html, put_html
+
 
 def _pw_writable_browsers_path() -> str:
     home = os.path.expanduser("~")
     return os.path.join(home, ".cache", "ms-playwright")
 
 
-def _ensure_playwright_chromium_installed() -> None:
-    if os.environ.get("PW_CHROMIUM_READY") == "1":
+# Chromium builds `playwright install chromium` drops under the browsers path
+# (full build, and the headless shell newer Playwright versions launch headless).
+_CHROMIUM_EXECUTABLES = (
+    os.path.join("chromium-*", "chrome-linux", "chrome"),
+    os.path.join("chromium_headless_shell-*", "chrome-linux", "headless_shell"),
+)
+
+
+def _ensure_playwright_chromium_installed(force: bool = False) -> None:
+    """Ensure Playwright Chromium exists (Streamlit Cloud safe path).
+
+    The env flag is not inherited by fresh worker processes, so an existing
+    install on disk also counts; `force` (after a launch already failed) skips both.
+    """
+    if not force and os.environ.get("PW_CHROMIUM_READY") == "1":
         return
 
     browsers_path = _pw_writable_browsers_path()
     os.makedirs(browsers_path, exist_ok=True)
     os.environ["PLAYWRIGHT_BROWSERS_PATH"] = browsers_path
 
+    if not force and any(glob.glob(os.path.join(browsers_path, exe)) for exe in _CHROMIUM_EXECUTABLES):
+        os.environ["PW_CHROMIUM_READY"] = "1"
+        return
+
     proc = subprocess.run(
         [sys.executable, "-m", "playwright", "install", "chromium"],
         stdout=subprocess.PIPE,
@@ -33,64 +55,154 @@ def _ensure_playwright_chromium_installed() -> None:
     os.environ["PW_CHROMIUM_READY"] = "1"
 
 
-async def _auto_scroll(page, steps: int = 10, step_px: int = 900, wait_ms: int = 200):
-    for _ in range(steps):
-        await page.mouse.wheel(0, step_px)
-        await page.wait_for_timeout(wait_ms)
-
-
-async def render_html(url: str, wait_ms: int = 1500) -> str:
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(
-            headless=True,
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--no-sandbox",
-                "--disable-dev-shm-usage",
-            ],
-        )
-
-        context = await browser.new_context(
-            user_agent=(
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/122.0.0.0 Safari/537.36"
-            ),
-            locale="ro-RO",
-            extra_http_headers={
-                "Accept-Language": "ro-RO,ro;q=0.9,en-US;q=0.8,en;q=0.7",
-                "DNT": "1",
-                "Upgrade-Insecure-Requests": "1",
-            },
-            viewport={"width": 1366, "height": 768},
-        )
+async def _settle(page, timeout_ms: int) -> None:
+    """Wait for network idle, but never longer than timeout_ms."""
+    try:
+        await page.wait_for_load_state("networkidle", timeout=timeout_ms)
+    except Exception:
+        pass
+
+
+# We only need the DOM: <img src> / data-src URLs are read from the HTML, not the bytes.
+_BLOCKED_RESOURCE_TYPES = {"image", "font", "media", "stylesheet"}
+# analytics / ad scripts never affect the product markup
+_BLOCKED_HOSTS = ("google-analytics.com", "googletagmanager.com", "doubleclick.net", "facebook.net", "hotjar.com")
+
+
+# Challenge / WAF pages name themselves in <title>. The body is no guide here:
+# "cookie", "consent" or a reCAPTCHA script show up on most real product pages.
+_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+_BLOCK_TITLE_RE = re.compile(
+    r"attention required|access denied|just a moment|captcha|enable javascript|forbidden|too many requests",
+    re.IGNORECASE,
+)
+
+
+def _looks_blocked(html: str) -> bool:
+    """True for empty, challenge or block pages, which must not go into the page cache."""
+    if len(html) < 1500:
+        return True
+    m = _TITLE_RE.search(html)
+    return m is not None and _BLOCK_TITLE_RE.search(m.group(1)) is not None
+
+
+async def _block_heavy(route):
+    request = route.request
+    host = urlsplit(request.url).hostname or ""
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or host.endswith(_BLOCKED_HOSTS):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+_LAUNCH_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+]
+
+
+async def _new_context(browser):
+    context = await browser.new_context(
+        user_agent=(
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+            "AppleWebKit/537.36 (KHTML, like Gecko) "
+            "Chrome/122.0.0.0 Safari/537.36"
+        ),
+        locale="ro-RO",
+        extra_http_headers={
+            "Accept-Language": "ro-RO,ro;q=0.9,en-US;q=0.8,en;q=0.7",
+            "DNT": "1",
+            "Upgrade-Insecure-Requests": "1",
+        },
+        viewport={"width": 1366, "height": 768},
+    )
+    await context.route("**/*", _block_heavy)
+    return context
 
-        page = await context.new_page()
 
+async def _render_page(context, url: str, wait_ms: int) -> str:
+    # wait_ms caps the post-load network-idle wait; fast pages continue as soon as they settle
+    page = await context.new_page()
+    try:
         # Hide webdriver flag (basic)
         await page.add_init_script(
             """Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"""
         )
 
         await page.goto(url, wait_until="domcontentloaded", timeout=60000)
-        await page.wait_for_timeout(wait_ms)
+        await _settle(page, wait_ms)
 
-        # Scroll a bit to trigger lazy-loaded images
-        await _auto_scroll(page, steps=12, step_px=900, wait_ms=200)
-        await page.wait_for_timeout(600)
+        return await page.content()
+    finally:
+        await page.close()
 
-        html = await page.content()
-        await context.close()
-        await browser.close()
-        return html
 
+async def render_html(url: str, wait_ms: int = 1500) -> str:
+    cached = get_html(url, "playwright")
+    if cached is not None:
+        return cached
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True, args=_LAUNCH_ARGS)
+        try:
+            context = await _new_context(browser)
+            html = await _render_page(context, url, wait_ms)
+        finally:
+            await browser.close()
+    if not _looks_blocked(html):
+        put_html(url, "playwright", html)
+    return html
+
+
+async def render_many(urls: list[str], concurrency: int = 8, wait_ms: int = 1500) -> list[str | BaseException]:
+    """Render a batch of URLs with a single Chromium process.
+
+    Returns one entry per URL, in order: the HTML, or the exception raised for that URL.
+    """
+    results: list[str | BaseException | None] = [get_html(u, "playwright") for u in urls]
+    todo = [i for i, r in enumerate(results) if r is None]
+    if not todo:
+        return results
 
-def render_html_sync(url: str, wait_ms: int = 1500) -> str:
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True, args=_LAUNCH_ARGS)
+        try:
+            contexts = [await _new_context(browser) for _ in range(min(concurrency, len(todo)))]
+            sem = asyncio.Semaphore(concurrency)
+
+            async def sem_fetch(i: int, url: str) -> str:
+                async with sem:
+                    html = await _render_page(contexts[i % len(contexts)], url, wait_ms)
+                if not _looks_blocked(html):
+                    put_html(url, "playwright", html)
+                return html
+
+            rendered = await asyncio.gather(
+                *[sem_fetch(i, urls[i]) for i in todo],
+                return_exceptions=True,
+            )
+        finally:
+            await browser.close()
+
+    for i, r in zip(todo, rendered):
+        results[i] = r
+    return results
+
+
+def _run_with_install_retry(make_coro):
     try:
-        return asyncio.run(render_html(url, wait_ms=wait_ms))
+        return asyncio.run(make_coro())
     except Exception as e:
         msg = str(e)
         if "Executable doesn't exist" in msg or "playwright install" in msg:
-            _ensure_playwright_chromium_installed()
-            return asyncio.run(render_html(url, wait_ms=wait_ms))
+            _ensure_playwright_chromium_installed(force=True)
+            return asyncio.run(make_coro())
         raise
+
+
+def render_html_sync(url: str, wait_ms: int = 1500) -> str:
+    return _run_with_install_retry(lambda: render_html(url, wait_ms=wait_ms))
+
+
+def render_many_sync(urls: list[str], concurrency: int = 8, wait_ms: int = 1500) -> list[str | BaseException]:
+    return _run_with_install_retry(lambda: render_many(urls, concurrency=concurrency, wait_ms=wait_ms))
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+import zstandard
+
+# Fetched pages, so re-running the same URL list (e.g. while debugging an import)
+# doesn't hit the suppliers again. SCRAPER_CACHE_TTL=0 turns the cache off.
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "gomag-scraper")
+
+
+def _ttl() -> float:
+    try:
+        return float(os.environ.get("SCRAPER_CACHE_TTL", "3600"))
+    except ValueError:
+        return 3600.0
+
+
+def _path(url: str, kind: str) -> str:
+    # kind separates plain HTTP from rendered / logged-in HTML of the same URL
+    key = hashlib.sha1(f"{kind}\n{url}".encode("utf-8")).hexdigest()
+    return os.path.join(CACHE_DIR, f"{key}.html.zst")
+
+
+def get_html(url: str, kind: str) -> str | None:
+    """Cached HTML for (url, kind) if younger than the TTL, else None."""
+    ttl = _ttl()
+    if ttl <= 0:
+        return None
+    path = _path(url, kind)
+    try:
+        if time.time() - os.stat(path).st_mtime >= ttl:
+            return None
+        with open(path, "rb") as f:
+            return zstandard.decompress(f.read()).decode("utf-8")
+    except (OSError, zstandard.ZstdError, UnicodeDecodeError):
+        return None
+
+
+def put_html(url: str, kind: str, html: str) -> None:
+    if _ttl() <= 0:
+        return
+    tmp = None
+    try:
+        data = zstandard.compress(html.encode("utf-8"), 3)
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # write-then-rename so concurrent readers never see a half-written entry
+        fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, _path(url, kind))
+    except (OSError, UnicodeError):
+        # the cache is best effort (read-only home, full disk, odd page encoding, ...)
+        if tmp is not None and os.path.exists(tmp):
+            os.remove(tmp)
+
+
+
+def clear_html() -> None:
+    """Drop every cached page, so the next fetch goes back to the suppliers."""
+    try:
+        names = os.listdir(CACHE_DIR)
+    except OSError:
+        return
+    for name in names:
+        if name.endswith(".html.zst"):
+            try:
+                os.remove(os.path.join(CACHE_DIR, name))
+            except OSError:
+                pass
+
+
+def get_state(name: str, ttl: float) -> dict | None:
+    """Saved Playwright storage_state `name` if younger than `ttl` seconds, else None."""
+    path = os.path.join(CACHE_DIR, f"{name}.json")
+    try:
+        if time.time() - os.stat(path).st_mtime >= ttl:
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def put_state(name: str, state: dict) -> None:
+    tmp = None
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        # session cookies: readable by the owner only, whatever the file it replaces allowed
+        os.fchmod(fd, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp, os.path.join(CACHE_DIR, f"{name}.json"))
+    except OSError:
+        # best effort, like the page cache; callers keep the in-memory state
+        if tmp is not None and os.path.exists(tmp):
+            os.remove(tmp)
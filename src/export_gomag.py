@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import functools
 import hashlib
+import io
 import os
 from typing import Dict, List
 
+import numpy as np
 import pandas as pd
 
 from .models import ProductDraft
@@ -11,14 +14,20 @@ from .models import ProductDraft
 TEMPLATE_PATH = os.path.join("assets", "modelImport.xlsx")
 
 
+@functools.lru_cache(maxsize=1)
 def _load_template_headers() -> List[str]:
-    """Loads the header row from Gomag's 'Model import' template (XLSX)."""
+    """Loads the header row from Gomag's 'Model import' template (XLSX).
+
+    The template is static, so it is read once per process; callers must not mutate the result.
+    """
     try:
         import openpyxl  # type: ignore
-        wb = openpyxl.load_workbook(TEMPLATE_PATH)
-        ws = wb.active
-        headers = [c.value for c in next(ws.iter_rows(min_row=1, max_row=1))]
-        headers = [h for h in headers if h]
+        wb = openpyxl.load_workbook(TEMPLATE_PATH, read_only=True, data_only=True, keep_links=False)
+        try:
+            row = next(wb.active.iter_rows(min_row=1, max_row=1, values_only=True))
+        finally:
+            wb.close()
+        headers = [h for h in row if h]
         if headers:
             return headers
     except Exception:
@@ -40,8 +49,13 @@ def _load_template_headers() -> List[str]:
     ]
 
 
+@functools.lru_cache(maxsize=4096)
 def _shorten_sku(sku: str, max_len: int = 30) -> str:
-    """Gomag limita SKU = 30. Pastreaza determinist si unic."""
+    """Gomag limita SKU = 30. Pastreaza determinist si unic.
+
+    Variantele aceluiasi produs repeta acelasi SKU lung, deci rezultatul e memorat.
+    Hash-ul ramane SHA-1: schimbarea lui ar schimba SKU-urile deja importate in Gomag.
+    """
     sku = (sku or "").strip()
     if len(sku) <= max_len:
         return sku
@@ -52,41 +66,79 @@ def _shorten_sku(sku: str, max_len: int = 30) -> str:
     return f"{prefix}-{h}"
 
 
+def _shorten_skus(skus: List[str], max_len: int = 30) -> List[str]:
+    """_shorten_sku over a column; only SKUs longer than max_len go through the hash path."""
+    s = pd.Series(skus, dtype=object).fillna("").astype(str).str.strip()
+    mask = s.str.len() > max_len
+    if mask.any():
+        s.loc[mask] = s[mask].map(lambda x: _shorten_sku(x, max_len))
+    return s.tolist()
+
+
+def _final_prices(prices: list) -> np.ndarray:
+    """ProductDraft.price_final() over a column: pret * 2, minim 1 leu; lipsa / invalid -> 1 leu."""
+    x = pd.to_numeric(pd.Series(prices, dtype=object), errors="coerce").to_numpy(dtype=np.float64)
+    out = np.where(x > 0, x * 2.0, 1.0)  # NaN compares False -> 1.0
+    np.maximum(out, 1.0, out=out)
+    np.round(out, 2, out=out)
+    return out
+
+
 def to_gomag_dataframe(products: List[ProductDraft], category_map: Dict[str, str] | None = None) -> pd.DataFrame:
     headers = _load_template_headers()
     category_map = category_map or {}
-    rows: List[dict] = []
+    n = len(products)
+
+    # Build column-wise: one list per column instead of one dict per product.
+    cols: Dict[str, list] = {h: [""] * n for h in headers}
 
-    for p in products:
-        cat = category_map.get(p.source_url, "") or ""
+    cols["Cod Produs (SKU)"] = _shorten_skus([p.sku for p in products])
+    cols["Denumire Produs"] = [p.title or "" for p in products]
+    cols["Descriere Produs"] = [p.description_html or "" for p in products]
+    cols["Descriere Scurta a Produsului"] = [p.short_description or "" for p in products]
+    cols["URL Poza de Produs"] = ["\n".join(filter(None, p.images or [])) for p in products]
 
-        row = {h: "" for h in headers}
+    cols["Pret"] = _final_prices([p.price for p in products])
+    cols["Moneda"] = ["RON"] * n
+    cols["Stoc Cantitativ"] = [1] * n
+    cols["Activ in Magazin"] = ["DA"] * n
 
-        row["Cod Produs (SKU)"] = _shorten_sku(p.sku)
-        row["Denumire Produs"] = p.title or ""
-        row["Descriere Produs"] = p.description_html or ""
-        row["Descriere Scurta a Produsului"] = p.short_description or ""
+    # TVA standard (RO): 21%
+    # IMPORTANT: nu completam "Pretul Include TVA" (il lasam gol) ca sa evite
+    # eroarea "setare diferita fata de varianta parinte" (Gomag mosteneste setarea).
+    cols["Pretul Include TVA"] = [""] * n
+    cols["Cota TVA"] = [21] * n
 
-        imgs = p.images or []
-        row["URL Poza de Produs"] = "\n".join([i for i in imgs if i])
+    cols["Categorie / Categorii"] = [category_map.get(p.source_url, "") or "" for p in products]
 
-        row["Pret"] = round(p.price_final(), 2)
-        row["Moneda"] = "RON"
-        row["Stoc Cantitativ"] = 1
-        row["Activ in Magazin"] = "DA"
+    return pd.DataFrame(cols, columns=headers)
 
-        # TVA standard (RO): 21%
-        # IMPORTANT: nu completam "Pretul Include TVA" (il lasam gol) ca sa evite
-        # eroarea "setare diferita fata de varianta parinte" (Gomag mosteneste setarea).
-        row["Pretul Include TVA"] = ""
-        row["Cota TVA"] = 21
 
-        row["Categorie / Categorii"] = cat
+def _write_xlsx(df: pd.DataFrame, target) -> None:
+    """Streams df to XLSX row by row (xlsxwriter constant_memory: only one row is kept in memory).
 
-        rows.append(row)
+    Rows are written directly rather than via df.to_excel(): pandas emits cells column by
+    column, which constant_memory mode would silently drop.
+    """
+    import xlsxwriter  # type: ignore
 
-    return pd.DataFrame(rows, columns=headers)
+    wb = xlsxwriter.Workbook(target, {"constant_memory": True})
+    try:
+        ws = wb.add_worksheet()
+        ws.write_row(0, 0, [str(c) for c in df.columns])
+        body = df.astype(object).where(df.notna(), "")
+        for i, row in enumerate(body.itertuples(index=False, name=None), start=1):
+            ws.write_row(i, 0, row)
+    finally:
+        wb.close()
 
 
 def save_xlsx(df: pd.DataFrame, path: str) -> None:
-    df.to_excel(path, index=False)
+    _write_xlsx(df, path)
+
+
+def to_xlsx_bytes(df: pd.DataFrame) -> bytes:
+    """Same file as save_xlsx, built in memory (for download buttons)."""
+    buf = io.BytesIO()
+    _write_xlsx(df, buf)
+    return buf.getvalue()
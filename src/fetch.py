@@ -1,56 +1,219 @@
 from __future__ import annotations
 
+import asyncio
+import atexit
+import threading
 import time
+from email.utils import parsedate_to_datetime
+
 import requests
-import cloudscraper
+import httpx
+from urllib3.exceptions import MaxRetryError
+from urllib3.util.retry import Retry
+
+from .cache import get_html, put_html
 
 DEFAULT_HEADERS = {
     "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120 Safari/537.36",
     "Accept-Language": "ro-RO,ro;q=0.9,en-US;q=0.8,en;q=0.7",
 }
 
+# Shared keep-alive (HTTP/2) clients for the async path. httpx connections belong to the
+# event loop that opened them, so there is one client per loop (the pipeline's asyncio.run
+# loop and the scrapers' background loop run at the same time); see close_client().
+_CLIENTS: dict = {}
+_CLIENTS_LOCK = threading.Lock()
 
-def _get_with_retries(get_fn, url: str, headers: dict, timeout: int, max_tries: int = 5) -> requests.Response:
-    """HTTP GET with retry/backoff for temporary blocks (429/5xx)."""
-    backoff = [1, 2, 4, 8, 15]  # seconds
-    last_exc: Exception | None = None
-    last_resp: requests.Response | None = None
 
-    for i in range(max_tries):
-        try:
-            r = get_fn(url, headers=headers, timeout=timeout)
-            last_resp = r
-            if r.status_code in (429, 500, 502, 503, 504, 520, 521, 522, 524):
-                if i < max_tries - 1:
-                    time.sleep(backoff[min(i, len(backoff) - 1)])
-                    continue
-            return r
-        except Exception as e:
-            last_exc = e
-            if i < max_tries - 1:
-                time.sleep(backoff[min(i, len(backoff) - 1)])
-                continue
-            raise
+_RETRY_STATUSES = (429, 500, 502, 503, 504, 520, 521, 522, 524)
+# Longest single Retry-After we honour; a server asking for an hour would stall the whole batch.
+_MAX_RETRY_AFTER = 30.0
 
-    if last_resp is not None:
-        return last_resp
-    if last_exc is not None:
-        raise last_exc
-    raise RuntimeError("request_failed")
 
+class _Retry(Retry):
+    """urllib3 Retry with the same policy as _get_with_retries."""
 
-def fetch_html(url: str, timeout: int = 30) -> tuple[str, str]:
-    """Return (html, method). Method in {'requests','cloudscraper'}"""
-    try:
-        r = _get_with_retries(requests.get, url, headers=DEFAULT_HEADERS, timeout=timeout, max_tries=4)
-        if r.status_code == 200 and len(r.text) > 2000:
-            return r.text, "requests"
-    except Exception:
-        pass
+    def get_backoff_time(self) -> float:
+        # urllib3 2.x doesn't sleep before the first retry (0, 2, 4s); back off 1, 2, 4s instead
+        n = len(self.history)
+        return 0.0 if n == 0 else self.backoff_factor * 2 ** (n - 1)
+
+    def get_retry_after(self, response):
+        delay = super().get_retry_after(response)
+        return None if delay is None else min(delay, _MAX_RETRY_AFTER)
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        # a Cloudflare challenge won't pass by waiting: give the response back (raise_on_status
+        # is off) so fetch_html hands it to cloudscraper. The body isn't read yet, so use the header.
+        if response is not None and _is_cloudflare_challenge_headers(response.status, response.headers):
+            raise MaxRetryError(_pool, url, None)
+        return super().increment(method, url, response, error, _pool, _stacktrace)
 
-    scraper = cloudscraper.create_scraper(
-        browser={"browser": "chrome", "platform": "linux", "desktop": True}
+
+def _with_retries(session: requests.Session, total: int) -> requests.Session:
+    """Retry/backoff (1, 2, 4, ...s; Retry-After honoured up to _MAX_RETRY_AFTER) for temporary
+    blocks (429/5xx) and connection errors on every adapter of the session, except Cloudflare
+    challenges; after the last try the response is returned."""
+    retry = _Retry(
+        total=total,
+        backoff_factor=1.0,
+        status_forcelist=_RETRY_STATUSES,
+        allowed_methods=["GET"],
+        raise_on_status=False,
     )
-    r = _get_with_retries(scraper.get, url, headers=DEFAULT_HEADERS, timeout=timeout, max_tries=5)
+    # Set on the existing adapters rather than mounting new ones: cloudscraper's https adapter
+    # carries its own TLS cipher setup.
+    for adapter in session.adapters.values():
+        adapter.max_retries = retry
+    return session
+
+
+# Shared keep-alive session for the sync path (connections are reused across URLs and retries).
+_SESSION = _with_retries(requests.Session(), total=3)
+_SESSION.headers.update(DEFAULT_HEADERS)
+
+
+def _is_cloudflare_challenge(status_code: int, text: str) -> bool:
+    return status_code in (403, 503) and ("cf-chl" in text or "Just a moment" in text)
+
+
+def _is_cloudflare_challenge_headers(status_code: int, headers) -> bool:
+    return status_code in (403, 503) and (headers.get("cf-mitigated") or "").lower() == "challenge"
+
+
+def _fetch_cloudscraper(url: str, timeout: int) -> tuple[str, str]:
+    # cloudscraper pulls in a JS interpreter; only load it when a Cloudflare challenge shows up
+    import cloudscraper
+
+    scraper = _with_retries(
+        cloudscraper.create_scraper(browser={"browser": "chrome", "platform": "linux", "desktop": True}),
+        total=4,
+    )
+    r = scraper.get(url, headers=DEFAULT_HEADERS, timeout=timeout)
     r.raise_for_status()
     return r.text, "cloudscraper"
+
+
+def fetch_html(url: str, timeout: int = 30) -> tuple[str, str]:
+    """Return (html, method). Method in {'requests','cloudscraper','cache'}"""
+    cached = get_html(url, "http")
+    if cached is not None:
+        return cached, "cache"
+    r = _SESSION.get(url, timeout=timeout)
+    if _is_cloudflare_challenge(r.status_code, r.text):
+        html, method = _fetch_cloudscraper(url, timeout)
+    else:
+        r.raise_for_status()
+        html, method = r.text, "requests"
+    put_html(url, "http", html)
+    return html, method
+
+
+def get_client() -> httpx.AsyncClient:
+    """Shared client for the running event loop (created on first use); don't close it, see close_client()."""
+    loop = asyncio.get_running_loop()
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(loop)
+        if client is None:
+            # a loop torn down without close_client() can't run aclose() any more; forget it
+            for dead in [lp for lp in _CLIENTS if lp.is_closed()]:
+                del _CLIENTS[dead]
+            client = _CLIENTS[loop] = httpx.AsyncClient(
+                http2=True,
+                headers=DEFAULT_HEADERS,
+                timeout=30,
+                follow_redirects=True,
+                limits=httpx.Limits(max_keepalive_connections=32),
+            )
+    return client
+
+
+async def close_client() -> None:
+    """Close the running loop's client; call before tearing that loop down."""
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+@atexit.register
+def _close_clients_at_exit() -> None:
+    with _CLIENTS_LOCK:
+        clients = list(_CLIENTS.items())
+        _CLIENTS.clear()
+    for loop, client in clients:
+        if loop.is_closed():
+            continue
+        try:
+            if loop.is_running():
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop).result(timeout=10)
+            else:
+                loop.run_until_complete(client.aclose())
+        except Exception:
+            pass
+
+
+def _retry_after(r: httpx.Response) -> float | None:
+    value = r.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+async def _get_with_retries(url: str, timeout: int, total: int = 3) -> httpx.Response:
+    """GET with the same policy as _with_retries: backoff 1, 2, 4s (or Retry-After, at most
+    _MAX_RETRY_AFTER) on 429/5xx and connection errors, no retry on a Cloudflare challenge;
+    after the last try the response is returned."""
+    for attempt in range(total + 1):
+        try:
+            r = await get_client().get(url, timeout=timeout)
+        except httpx.TransportError:
+            if attempt == total:
+                raise
+            await asyncio.sleep(2 ** attempt)
+            continue
+        # a Cloudflare challenge won't pass by waiting; cloudscraper handles it
+        if (
+            attempt == total
+            or r.status_code not in _RETRY_STATUSES
+            or _is_cloudflare_challenge_headers(r.status_code, r.headers)
+            or _is_cloudflare_challenge(r.status_code, r.text)
+        ):
+            return r
+        delay = _retry_after(r) if r.status_code in (429, 503) else None
+        await asyncio.sleep(2 ** attempt if delay is None else min(delay, _MAX_RETRY_AFTER))
+    return r
+
+
+async def fetch_html_async(url: str, timeout: int = 30) -> tuple[str, str]:
+    """Async fetch_html over the shared client. Method in {'httpx','cloudscraper','cache'}"""
+    cached = get_html(url, "http")
+    if cached is not None:
+        return cached, "cache"
+    r = await _get_with_retries(url, timeout)
+    if _is_cloudflare_challenge(r.status_code, r.text):
+        html, method = await asyncio.to_thread(_fetch_cloudscraper, url, timeout)
+    else:
+        r.raise_for_status()
+        html, method = r.text, "httpx"
+    put_html(url, "http", html)
+    return html, method
+
+
+async def fetch_many(urls: list[str], timeout: int = 30, concurrency: int = 8) -> list[tuple[str, str] | BaseException]:
+    """fetch_html_async for a batch, at most `concurrency` requests in flight;
+    one entry per URL, the exception if that URL failed."""
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one(url: str) -> tuple[str, str]:
+        async with sem:
+            return await fetch_html_async(url, timeout=timeout)
+
+    return await asyncio.gather(*[one(u) for u in urls], return_exceptions=True)
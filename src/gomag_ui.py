@@ -1,39 +1,31 @@
 import asyncio
+import functools
+import hashlib
 import os
-import subprocess
-import sys
+import threading
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+from urllib.parse import urlsplit
 
 import yaml
-from bs4 import BeautifulSoup
 from playwright.async_api import async_playwright
+from selectolax.lexbor import LexborHTMLParser
 
-# No __future__ import to avoid SyntaxError in patched environments.
-
-def _pw_writable_browsers_path() -> str:
-    home = os.path.expanduser("~")
-    return os.path.join(home, ".cache", "ms-playwright")
-
+from .browser import _ensure_playwright_chromium_installed
+from .cache import get_state, put_state
 
-def _ensure_playwright_chromium_installed() -> None:
-    if os.environ.get("PW_CHROMIUM_READY") == "1":
-        return
-    browsers_path = _pw_writable_browsers_path()
-    os.makedirs(browsers_path, exist_ok=True)
-    os.environ["PLAYWRIGHT_BROWSERS_PATH"] = browsers_path
-    proc = subprocess.run(
-        [sys.executable, "-m", "playwright", "install", "chromium"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
-    )
-    if proc.returncode != 0:
-        raise RuntimeError(f"playwright install failed (code={proc.returncode}):\n{proc.stdout}")
-    os.environ["PW_CHROMIUM_READY"] = "1"
+# No __future__ import to avoid SyntaxError in patched environments.
 
+# CSS selectors used by the HTML parsers (Gomag list pages can have thousands of rows).
+_SEL_TABLE_ROWS = "table tbody tr"
+_SEL_G2_ROWS = "#content .-g2-table .-g2-table-row:not(.-g2-table-head)"
+_SEL_ERR_LINK = 'a[href*="/gomag/product/import/err"]'
+_SEL_CONTENT_LI = "#content li"
+# flash messages / toasts the shop may show after Start Import
+_SEL_BANNERS = '.alert, .notification, .toast, [role="alert"], .swal2-popup'
+_G2_COL_CLASS = "-g2-table-col"
 
-async def _launch_ctx(p):
+async def _launch_ctx(p, storage_state: Optional[dict] = None):
     browser = await p.chromium.launch(
         headless=True,
         args=[
@@ -43,12 +35,19 @@ async def _launch_ctx(p):
             "--ignore-certificate-errors",
         ],
     )
-    context = await browser.new_context(ignore_https_errors=True, viewport={"width": 1366, "height": 850})
+    # Reuse cookies/localStorage saved after a previous login, if any.
+    context = await browser.new_context(
+        ignore_https_errors=True,
+        viewport={"width": 1366, "height": 850},
+        storage_state=storage_state,
+    )
     page = await context.new_page()
     return browser, context, page
 
 
+@functools.lru_cache(maxsize=1)
 def _load_cfg() -> dict:
+    """Parsed once per process; callers must not mutate the returned dict."""
     cfg_path = os.path.join("config", "config.yaml")
     if os.path.exists(cfg_path):
         with open(cfg_path, "r", encoding="utf-8") as f:
@@ -81,8 +80,48 @@ async def _goto_with_fallback(page, url: str):
         await page.goto(http_url, wait_until="domcontentloaded", timeout=120000)
 
 
+async def _wait_import_started(page, click, timeout_ms: int = 15000) -> bool:
+    """Run `click` and wait until the shop reacts: one of its form posts / XHRs (any non-GET,
+    or a URL mentioning "import") finishes, or a new banner shows up. False if neither happens in time."""
+    banners_before = await page.locator(_SEL_BANNERS).count()
+    # the shop's own requests only: analytics beacons also POST
+    host = urlsplit(page.url).hostname
+    waits = {
+        asyncio.ensure_future(page.wait_for_event(
+            "requestfinished",
+            predicate=lambda r: (
+                r.resource_type in ("document", "xhr", "fetch")
+                and urlsplit(r.url).hostname == host
+                and (r.method != "GET" or "import" in r.url)
+            ),
+            timeout=timeout_ms,
+        )),
+        asyncio.ensure_future(page.wait_for_function(
+            "([sel, n]) => document.querySelectorAll(sel).length > n",
+            arg=[_SEL_BANNERS, banners_before],
+            timeout=timeout_ms,
+        )),
+    }
+    pending = waits
+    try:
+        await click()
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            if any(t.exception() is None for t in done):
+                return True
+        return False
+    finally:
+        for t in pending:
+            t.cancel()
+        await asyncio.gather(*waits, return_exceptions=True)
+
+
 async def _wait_render(page, ms: int = 1200):
-    await page.wait_for_timeout(ms)
+    """Wait until the page's network is idle, at most `ms` milliseconds."""
+    try:
+        await page.wait_for_load_state("networkidle", timeout=ms)
+    except Exception:
+        pass
 
 
 @dataclass
@@ -92,31 +131,87 @@ class GomagCreds:
     password: str
 
 
+# past this age, log in from scratch rather than trust old session cookies
+_STATE_TTL = 6 * 3600
+
+
+def _state_name(creds: GomagCreds) -> str:
+    """Cache entry for the logged-in storage_state (cookies + localStorage), per shop + account."""
+    key = hashlib.sha1(f"{creds.base_url.rstrip('/')}|{creds.email}".encode("utf-8")).hexdigest()[:12]
+    return f"gomag_state_{key}"
+
+
+def _load_state(creds: GomagCreds) -> Optional[dict]:
+    return get_state(_state_name(creds), _STATE_TTL)
+
+
+async def _save_state(context, creds: GomagCreds) -> None:
+    put_state(_state_name(creds), await context.storage_state())
+
+
+async def _on_login_page(page, cfg: dict) -> bool:
+    return "login" in page.url.lower() or await page.locator(cfg["gomag"]["login"]["password_selector"]).count() > 0
+
+
 async def _login(page, creds: GomagCreds, cfg: dict):
     base = creds.base_url.rstrip("/")
     await _goto_with_fallback(page, base + "/gomag/dashboard")
-    await _wait_render(page, 900)
 
+    # Session restored from a saved storage_state: no login form, nothing to do.
+    if not await _on_login_page(page, cfg):
+        return
+
+    # fill() waits for the form fields itself
     await page.fill(cfg["gomag"]["login"]["email_selector"], creds.email)
     await page.fill(cfg["gomag"]["login"]["password_selector"], creds.password)
     await page.click(cfg["gomag"]["login"]["submit_selector"])
-    await _wait_render(page, 1500)
+    try:
+        await page.wait_for_url(lambda u: "dashboard" in u and "login" not in u.lower(), timeout=15000)
+        await _save_state(page.context, creds)
+    except Exception:
+        pass
+
+
+async def _goto_logged_in(page, creds: GomagCreds, cfg: dict, url: str):
+    """Like _goto_with_fallback, but logs in again if the session expired and Gomag redirected to the login form."""
+    await _goto_with_fallback(page, url)
+    if not await _on_login_page(page, cfg):
+        return
+    await _login(page, creds, cfg)
+    await _goto_with_fallback(page, url)
+    if await _on_login_page(page, cfg):
+        raise RuntimeError("Autentificarea in Gomag a esuat (verifica email/parola).")
+
+
+def _tree(html: str) -> LexborHTMLParser:
+    tree = LexborHTMLParser(html or "")
+    tree.strip_tags(["script", "style"])
+    return tree
+
+
+def _text(node) -> str:
+    return " ".join(node.text(deep=True, separator=" ").split())
+
+
+def _g2_cols(row) -> list:
+    # direct children with the column class (":scope > .-g2-table-col")
+    return [c for c in row.iter() if _G2_COL_CLASS in (c.attributes.get("class") or "").split()]
 
 
 def _parse_categories(html: str) -> List[Tuple[str, str]]:
-    soup = BeautifulSoup(html or "", "lxml")
+    tree = _tree(html)
     out: List[Tuple[str, str]] = []
     # categories list page can be normal table or g2 div table
-    for tr in soup.select("table tbody tr"):
-        tds = tr.find_all("td")
+    for tr in tree.css(_SEL_TABLE_ROWS):
+        tds = tr.css("td")
         if tds:
-            name = tds[0].get_text(" ", strip=True)
+            name = _text(tds[0])
             if name:
                 out.append((name, name))
-    for row in soup.select("#content .-g2-table .-g2-table-row:not(.-g2-table-head)"):
-        cols = row.select(":scope > .-g2-table-col")
+    for row in tree.css(_SEL_G2_ROWS):
+        cols = _g2_cols(row)
         if cols:
-            name = cols[0].get_text(" ", strip=True)
+            name = _text(cols[0])
             if name:
                 out.append((name, name))
     # de-dup
@@ -130,22 +225,29 @@ def _parse_categories(html: str) -> List[Tuple[str, str]]:
     return uniq
 
 
-async def fetch_categories_async(creds: GomagCreds) -> List[Tuple[str, str]]:
+async def fetch_categories_async(creds: GomagCreds, page=None) -> List[Tuple[str, str]]:
+    """Reads the category list. With `page` given (already logged in), reuses it."""
     cfg = _load_cfg()
-    _ensure_playwright_chromium_installed()
+    if page is None:
+        _ensure_playwright_chromium_installed()
+        async with async_playwright() as p:
+            browser, context, page = await _launch_ctx(p, storage_state=_load_state(creds))
+            try:
+                await _login(page, creds, cfg)
+                return await fetch_categories_async(creds, page=page)
+            finally:
+                await context.close()
+                await browser.close()
+
     base = creds.base_url.rstrip("/")
     url = base + cfg["gomag"]["categories"]["url_path"]
-
-    async with async_playwright() as p:
-        browser, context, page = await _launch_ctx(p)
-        try:
-            await _login(page, creds, cfg)
-            await _goto_with_fallback(page, url)
-            await _wait_render(page, 1600)
-            return _parse_categories(await page.content())
-        finally:
-            await context.close()
-            await browser.close()
+    await _goto_logged_in(page, creds, cfg, url)
+    await _wait_render(page, 1600)
+    cats = _parse_categories(await page.content())
+    if not cats:
+        # an empty list would be cached as a valid answer; make it an error instead
+        raise RuntimeError(f"Nu am gasit nicio categorie in {page.url}.")
+    return cats
 
 
 def fetch_categories(creds: GomagCreds) -> List[Tuple[str, str]]:
@@ -153,195 +255,267 @@ def fetch_categories(creds: GomagCreds) -> List[Tuple[str, str]]:
 
 
 def _extract_first_row(html: str):
-    soup = BeautifulSoup(html or "", "lxml")
+    tree = _tree(html)
 
     # Case A: classic <table>
-    tr = soup.select_one("table tbody tr")
+    tr = tree.css_first(_SEL_TABLE_ROWS)
     if tr:
-        tds = [td.get_text(" ", strip=True) for td in tr.find_all("td")]
+        tds = [_text(td) for td in tr.css("td")]
         first_text = " | ".join([t for t in tds if t]).strip()
         status_txt = (tds[-1] if tds else "").strip()
-        a = tr.select_one("a")
-        href = (a.get("href") if a else "") or ""
+        a = tr.css_first("a")
+        href = (a.attributes.get("href") if a else "") or ""
         # if there is an "err" link, prefer it
-        aerr = tr.select_one('a[href*="/gomag/product/import/err"]')
-        if aerr and aerr.get("href"):
-            href = aerr.get("href")
+        aerr = tr.css_first(_SEL_ERR_LINK)
+        if aerr and aerr.attributes.get("href"):
+            href = aerr.attributes.get("href")
         return first_text, status_txt, (href or "").strip()
 
     # Case B: Gomag backend uses div-table (-g2-table)
-    row = soup.select_one("#content .-g2-table .-g2-table-row:not(.-g2-table-head)")
+    row = tree.css_first(_SEL_G2_ROWS)
     if row:
-        cols = row.select(":scope > .-g2-table-col")
-        tds = [c.get_text(" ", strip=True) for c in cols]
+        cols = _g2_cols(row)
+        tds = [_text(c) for c in cols]
         first_text = " | ".join([t for t in tds if t]).strip()
         status_txt = tds[-1].strip() if tds else ""
-        aerr = row.select_one('a[href*="/gomag/product/import/err"]')
-        href = (aerr.get("href") if aerr else "") or ""
+        aerr = row.css_first(_SEL_ERR_LINK)
+        href = (aerr.attributes.get("href") if aerr else "") or ""
         return first_text, status_txt, href.strip()
 
     return "", "", ""
 
 
 def _extract_import_errors(html: str) -> List[str]:
-    soup = BeautifulSoup(html or "", "lxml")
+    tree = _tree(html)
     errors: List[str] = []
 
     # Classic table errors
-    for tr in soup.select("table tbody tr")[:10]:
-        tds = [td.get_text(" ", strip=True) for td in tr.find_all("td")]
+    for tr in tree.css(_SEL_TABLE_ROWS)[:10]:
+        tds = [_text(td) for td in tr.css("td")]
         if tds:
             errors.append(" | ".join(tds))
 
     # g2 div-table errors (if used)
     if not errors:
-        for row in soup.select("#content .-g2-table .-g2-table-row:not(.-g2-table-head)")[:10]:
-            cols = [c.get_text(" ", strip=True) for c in row.select(":scope > .-g2-table-col")]
+        for row in tree.css(_SEL_G2_ROWS)[:10]:
+            cols = [_text(c) for c in _g2_cols(row)]
             cols = [c for c in cols if c]
             if cols:
                 errors.append(" | ".join(cols))
 
     # Sometimes errors are plain list items
     if not errors:
-        for li in soup.select("#content li")[:10]:
-            t = li.get_text(" ", strip=True)
+        for li in tree.css(_SEL_CONTENT_LI)[:10]:
+            t = _text(li)
             if t and len(t) > 5:
                 errors.append(t)
 
     return errors
 
 
-async def import_file_async(creds: GomagCreds, file_path: str) -> str:
+async def import_file_async(creds: GomagCreds, file_path: str, page=None) -> str:
+    """Uploads the XLSX and starts the import. With `page` given (already logged in), reuses it."""
     cfg = _load_cfg()
-    _ensure_playwright_chromium_installed()
+    if page is None:
+        _ensure_playwright_chromium_installed()
+        async with async_playwright() as p:
+            browser, context, page = await _launch_ctx(p, storage_state=_load_state(creds))
+            try:
+                await _login(page, creds, cfg)
+                return await import_file_async(creds, file_path, page=page)
+            finally:
+                await context.close()
+                await browser.close()
 
     base = creds.base_url.rstrip("/")
     add_url = base + cfg["gomag"]["import"]["url_path"]
     list_url = base + "/gomag/product/import/list"
 
-    async with async_playwright() as p:
-        browser, context, page = await _launch_ctx(p)
-        try:
-            await _login(page, creds, cfg)
-
-            # snapshot before
-            before_html = ""
-            try:
-                await _goto_with_fallback(page, list_url)
-                await _wait_render(page, 1400)
-                before_html = await page.content()
-            except Exception:
-                before_html = ""
-            before_first, _, _ = _extract_first_row(before_html)
+    # snapshot before
+    before_html = ""
+    try:
+        await _goto_logged_in(page, creds, cfg, list_url)
+        await _wait_render(page, 1400)
+        before_html = await page.content()
+    except Exception:
+        before_html = ""
+    before_first, _, _ = _extract_first_row(before_html)
 
-            # go add
-            await _goto_with_fallback(page, add_url)
-            await _wait_render(page, 1400)
+    # go add
+    await _goto_logged_in(page, creds, cfg, add_url)
+    await _wait_render(page, 1400)
 
-            # unhide inputs
-            try:
-                await page.evaluate("""() => {
-                    document.querySelectorAll('input[type=file]').forEach(el => {
-                        el.style.display='block';
-                        el.style.visibility='visible';
-                        el.style.opacity='1';
-                        el.removeAttribute('hidden');
-                    });
-                }""")
-            except Exception:
-                pass
+    # unhide inputs
+    try:
+        await page.evaluate("""() => {
+            document.querySelectorAll('input[type=file]').forEach(el => {
+                el.style.display='block';
+                el.style.visibility='visible';
+                el.style.opacity='1';
+                el.removeAttribute('hidden');
+            });
+        }""")
+    except Exception:
+        pass
 
-            async def _try_upload_in(loc) -> bool:
+    async def _try_upload_in(loc) -> bool:
+        try:
+            cnt = await loc.count()
+            for i in range(cnt):
                 try:
-                    cnt = await loc.count()
-                    for i in range(cnt):
-                        try:
-                            await loc.nth(i).set_input_files(file_path, timeout=60000)
-                            return True
-                        except Exception:
-                            continue
+                    await loc.nth(i).set_input_files(file_path, timeout=60000)
+                    return True
                 except Exception:
-                    return False
-                return False
-
-            uploaded = await _try_upload_in(page.locator('input[type="file"]'))
-            if not uploaded:
-                for fr in page.frames:
-                    if fr == page.main_frame:
-                        continue
-                    if await _try_upload_in(fr.locator('input[type="file"]')):
-                        uploaded = True
-                        break
-            if not uploaded:
-                os.makedirs("debug_artifacts", exist_ok=True)
-                await page.screenshot(path="debug_artifacts/gomag_upload_no_file_input.png", full_page=True)
-                with open("debug_artifacts/gomag_upload_no_file_input.html", "w", encoding="utf-8") as f:
-                    f.write(await page.content())
-                raise RuntimeError("Nu am gasit input[type=file] utilizabil pentru upload (vezi debug_artifacts).")
-
-            await _wait_render(page, 1200)
-
-            # click Start Import
-            btn = page.locator('button:has-text("Start Import"), a:has-text("Start Import"), [role="button"]:has-text("Start Import")').first
-            if await btn.count() == 0:
-                os.makedirs("debug_artifacts", exist_ok=True)
-                await page.screenshot(path="debug_artifacts/gomag_no_start_import.png", full_page=True)
-                with open("debug_artifacts/gomag_no_start_import.html", "w", encoding="utf-8") as f:
-                    f.write(await page.content())
-                raise RuntimeError("Nu gasesc butonul Start Import (vezi debug_artifacts).")
-            await btn.click(timeout=10000, force=True)
-            await page.wait_for_timeout(2500)
-
-            # list page after
-            await _goto_with_fallback(page, list_url)
+                    continue
+        except Exception:
+            return False
+        return False
+
+    uploaded = await _try_upload_in(page.locator('input[type="file"]'))
+    if not uploaded:
+        for fr in page.frames:
+            if fr == page.main_frame:
+                continue
+            if await _try_upload_in(fr.locator('input[type="file"]')):
+                uploaded = True
+                break
+    if not uploaded:
+        os.makedirs("debug_artifacts", exist_ok=True)
+        await page.screenshot(path="debug_artifacts/gomag_upload_no_file_input.png", full_page=True)
+        with open("debug_artifacts/gomag_upload_no_file_input.html", "w", encoding="utf-8") as f:
+            f.write(await page.content())
+        raise RuntimeError("Nu am gasit input[type=file] utilizabil pentru upload (vezi debug_artifacts).")
+
+    await _wait_render(page, 1200)
+
+    # click Start Import
+    btn = page.locator('button:has-text("Start Import"), a:has-text("Start Import"), [role="button"]:has-text("Start Import")').first
+    if await btn.count() == 0:
+        os.makedirs("debug_artifacts", exist_ok=True)
+        await page.screenshot(path="debug_artifacts/gomag_no_start_import.png", full_page=True)
+        with open("debug_artifacts/gomag_no_start_import.html", "w", encoding="utf-8") as f:
+            f.write(await page.content())
+        raise RuntimeError("Nu gasesc butonul Start Import (vezi debug_artifacts).")
+    started = await _wait_import_started(page, lambda: btn.click(timeout=10000, force=True))
+    # the list below is the real check; say so when the shop gave no sign of starting the import
+    wait_note = "" if started else " (Gomag nu a confirmat pornirea importului in 15s.)"
+
+    # list page after
+    await _goto_logged_in(page, creds, cfg, list_url)
+    await _wait_render(page, 1600)
+    after_html = await page.content()
+
+    # sometimes HTML blank, try reload
+    if after_html.strip().replace(" ", "") == "<html><head></head><body></body></html>":
+        try:
+            await page.reload(wait_until="domcontentloaded", timeout=120000)
+        except Exception:
+            pass
+        await _wait_render(page, 1600)
+        after_html = await page.content()
+
+    first_text, status_txt, href = _extract_first_row(after_html)
+
+    if before_first and first_text and first_text == before_first:
+        return "Start Import apasat, dar nu a aparut un import nou in lista." + wait_note
+
+    if not first_text:
+        os.makedirs("debug_artifacts", exist_ok=True)
+        await page.screenshot(path="debug_artifacts/gomag_import_list_empty.png", full_page=True)
+        with open("debug_artifacts/gomag_import_list_empty.html", "w", encoding="utf-8") as f:
+            f.write(after_html)
+        return "Import nou detectat, dar nu am putut extrage randul din lista (nu am gasit randuri in pagina). Am salvat debug_artifacts/gomag_import_list_empty.*" + wait_note
+
+    # If we have an errors link, fetch it and extract first errors
+    if href:
+        if href.startswith("/"):
+            err_url = base + href
+        elif href.startswith("http"):
+            err_url = href
+        else:
+            err_url = base + "/" + href.lstrip("/")
+
+        # If status indicates errors, read details
+        if "erori" in (status_txt or "").lower() or "erori" in first_text.lower():
+            await _goto_logged_in(page, creds, cfg, err_url)
             await _wait_render(page, 1600)
-            after_html = await page.content()
+            err_html = await page.content()
+            errs = _extract_import_errors(err_html)
+            if errs:
+                return "Finalizat cu erori. Primele erori:\n- " + "\n- ".join(errs[:10])
+
+    return f"OK: import nou detectat. Status='{status_txt}'. Primul rand: {first_text[:200]}"
 
-            # sometimes HTML blank, try reload
-            if after_html.strip().replace(" ", "") == "<html><head></head><body></body></html>":
-                await page.wait_for_timeout(1200)
+
+def import_file(creds: GomagCreds, file_path: str) -> str:
+    return asyncio.run(import_file_async(creds, file_path))
+
+
+class GomagSession:
+    """Logged-in Gomag browser kept alive between operations (playwright, browser, context, page).
+
+    Playwright objects belong to the event loop that created them, so the session owns a loop
+    running in a daemon thread and the sync methods below submit work to it, one at a time.
+    """
+
+    def __init__(self, creds: GomagCreds):
+        self.creds = creds
+        self.page = None
+        self._pw = None
+        self._browser = None
+        self._context = None
+        self._logged_in = False
+        self._lock = threading.Lock()
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+
+    def _run(self, coro):
+        with self._lock:
+            return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    async def _login_once(self):
+        if self.page is None:
+            _ensure_playwright_chromium_installed()
+            self._pw = await async_playwright().start()
+            self._browser, self._context, self.page = await _launch_ctx(self._pw, storage_state=_load_state(self.creds))
+            self._logged_in = False
+        if not self._logged_in:
+            await _login(self.page, self.creds, _load_cfg())
+            self._logged_in = True
+
+    async def _close(self):
+        for closer in (self._context, self._browser):
+            if closer is not None:
                 try:
-                    await page.reload(wait_until="domcontentloaded", timeout=120000)
+                    await closer.close()
                 except Exception:
                     pass
-                await _wait_render(page, 1600)
-                after_html = await page.content()
-
-            first_text, status_txt, href = _extract_first_row(after_html)
-
-            if before_first and first_text and first_text == before_first:
-                return "Start Import apasat, dar nu a aparut un import nou in lista."
-
-            if not first_text:
-                os.makedirs("debug_artifacts", exist_ok=True)
-                await page.screenshot(path="debug_artifacts/gomag_import_list_empty.png", full_page=True)
-                with open("debug_artifacts/gomag_import_list_empty.html", "w", encoding="utf-8") as f:
-                    f.write(after_html)
-                return "Import nou detectat, dar nu am putut extrage randul din lista (nu am gasit randuri in pagina). Am salvat debug_artifacts/gomag_import_list_empty.*"
-
-            # If we have an errors link, fetch it and extract first errors
-            if href:
-                if href.startswith("/"):
-                    err_url = base + href
-                elif href.startswith("http"):
-                    err_url = href
-                else:
-                    err_url = base + "/" + href.lstrip("/")
-
-                # If status indicates errors, read details
-                if "erori" in (status_txt or "").lower() or "erori" in first_text.lower():
-                    await _goto_with_fallback(page, err_url)
-                    await _wait_render(page, 1600)
-                    err_html = await page.content()
-                    errs = _extract_import_errors(err_html)
-                    if errs:
-                        return "Finalizat cu erori. Primele erori:\n- " + "\n- ".join(errs[:10])
-
-            return f"OK: import nou detectat. Status='{status_txt}'. Primul rand: {first_text[:200]}"
-        finally:
-            await context.close()
-            await browser.close()
+        if self._pw is not None:
+            try:
+                await self._pw.stop()
+            except Exception:
+                pass
+        self._pw = self._browser = self._context = self.page = None
+        self._logged_in = False
 
+    async def _with_page(self, op=None):
+        try:
+            await self._login_once()
+            if op is not None:
+                return await op(self.page)
+        except Exception:
+            # drop a possibly broken browser/session; the next call starts fresh
+            await self._close()
+            raise
 
-def import_file(creds: GomagCreds, file_path: str) -> str:
-    return asyncio.run(import_file_async(creds, file_path))
+    def login_once(self) -> None:
+        self._run(self._with_page())
+
+    def fetch_categories(self) -> List[Tuple[str, str]]:
+        return self._run(self._with_page(lambda page: fetch_categories_async(self.creds, page=page)))
+
+    def import_file(self, file_path: str) -> str:
+        return self._run(self._with_page(lambda page: import_file_async(self.creds, file_path, page=page)))
+
+    def close(self) -> None:
+        self._run(self._close())
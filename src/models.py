@@ -2,7 +2,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional
 
-@dataclass
+@dataclass(slots=True)
 class Variant:
     color: Optional[str] = None
     size: Optional[str] = None
@@ -10,7 +10,7 @@ class Variant:
     price: Optional[float] = None
     images: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class ProductDraft:
     source_url: str
     domain: str
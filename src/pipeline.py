@@ -1,26 +1,147 @@
 from __future__ import annotations
-from typing import List
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Optional
+from .browser import render_many_sync
+from .fetch import close_client, fetch_many
 from .scrapers import get_scraper
+from .scrapers.generic import GenericScraper, needs_render
 from .models import ProductDraft
 
-def scrape_products(urls: List[str]) -> List[ProductDraft]:
-    out = []
-    for url in urls:
-        s = get_scraper(url)
+def _error_draft(url: str, e: BaseException) -> ProductDraft:
+    # fallback minimal draft
+    return ProductDraft(
+        source_url=url,
+        domain="",
+        sku="",
+        title="(EROARE SCRAPING)",
+        description_html="",
+        short_description="",
+        images=[],
+        price=None,
+        needs_translation=False,
+        notes=f"error={type(e).__name__}: {e}"
+    )
+
+# Below this many pages the process pool start-up costs more than parallel parsing saves.
+_PROCESS_POOL_MIN = 8
+# By the time we parse, this process runs threads (scraper loop, executors) and holds
+# Playwright pipes / HTTP connections; forking that can deadlock, so workers start clean.
+_MP_CONTEXT = multiprocessing.get_context("forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn")
+
+def _parse_one(job) -> ProductDraft:
+    """Parse one fetched page (top-level so it can run in a worker process)."""
+    url, html, method, tried_playwright, pw_error = job
+    try:
+        return GenericScraper().parse_html(url, html, method, tried_playwright=tried_playwright, pw_error=pw_error)
+    except Exception as e:
+        return _error_draft(url, e)
+
+def _generic_backend(scraper) -> Optional[GenericScraper]:
+    """GenericScraper behind a scraper (itself, or the thin per-domain wrappers)."""
+    if isinstance(scraper, GenericScraper):
+        return scraper
+    g = getattr(scraper, "_g", None)
+    return g if isinstance(g, GenericScraper) else None
+
+async def _parse_generic(urls: List[str], idx: List[int], concurrency: int, out: List[Optional[ProductDraft]]) -> None:
+    # 1) plain HTTP for every generic-backed URL, concurrently over one pooled client
+    fetched = dict(zip(idx, await fetch_many([urls[i] for i in idx], concurrency=concurrency)))
+
+    # 2) one shared Chromium for every page that came back blocked / JS-only
+    to_render = [i for i, r in fetched.items() if not isinstance(r, BaseException) and needs_render(r[0])]
+    rendered: dict = {}
+    if to_render:
+        try:
+            res = await asyncio.to_thread(render_many_sync, [urls[i] for i in to_render], concurrency=concurrency, wait_ms=2500)
+            rendered = dict(zip(to_render, res))
+        except Exception as e:
+            rendered = {i: e for i in to_render}
+
+    # 3) parse (CPU-bound): spread over processes for larger batches
+    jobs = []
+    for i in idx:
+        url = urls[i]
+        r = fetched[i]
+        if isinstance(r, BaseException):
+            out[i] = _error_draft(url, r)
+            continue
+        html, method = r
+        pw_error = ""
+        if i in rendered:
+            res = rendered[i]
+            if isinstance(res, BaseException):
+                pw_error = f"playwright_failed={type(res).__name__}: {res}"
+            else:
+                html, method = res, "playwright"
+        jobs.append((i, (url, html, method, i in rendered, pw_error)))
+
+    if len(jobs) >= _PROCESS_POOL_MIN:
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(jobs)), mp_context=_MP_CONTEXT) as ex:
+            drafts = await asyncio.gather(*[loop.run_in_executor(ex, _parse_one, job) for _, job in jobs])
+    else:
+        drafts = [_parse_one(job) for _, job in jobs]
+    for (i, _), draft in zip(jobs, drafts):
+        out[i] = draft
+
+async def scrape_products_async(urls: List[str], concurrency: int = 8) -> List[ProductDraft]:
+    scrapers = [get_scraper(url) for url in urls]
+    out: List[Optional[ProductDraft]] = [None] * len(urls)
+
+    generic = [i for i, s in enumerate(scrapers) if _generic_backend(s) is not None]
+    own = sorted(set(range(len(urls))) - set(generic))
+
+    # scrapers with a parse_batch() take all their URLs at once (one browser / login)
+    batched: dict = {}
+    for i in own:
+        if hasattr(scrapers[i], "parse_batch"):
+            batched.setdefault(scrapers[i], []).append(i)
+    own = [i for i in own if not hasattr(scrapers[i], "parse_batch")]
+
+    # scrapers with their own fetch flow (login / Playwright) are blocking: run them
+    # on a bounded thread pool alongside the generic batch
+    loop = asyncio.get_running_loop()
+    sem = asyncio.Semaphore(concurrency)
+    pool = ThreadPoolExecutor(max_workers=concurrency)
+
+    async def _one(i: int) -> ProductDraft:
+        async with sem:
+            return await loop.run_in_executor(pool, scrapers[i].parse, urls[i])
+
+    async def _batch(scraper, ids: List[int]) -> list:
         try:
-            out.append(s.parse(url))
+            return await asyncio.to_thread(scraper.parse_batch, [urls[i] for i in ids], concurrency=concurrency)
         except Exception as e:
-            # fallback minimal draft
-            out.append(ProductDraft(
-                source_url=url,
-                domain="",
-                sku="",
-                title="(EROARE SCRAPING)",
-                description_html="",
-                short_description="",
-                images=[],
-                price=None,
-                needs_translation=False,
-                notes=f"error={type(e).__name__}: {e}"
-            ))
+            return [e] * len(ids)
+
+    async def _own() -> None:
+        for i, r in zip(own, await asyncio.gather(*[_one(i) for i in own], return_exceptions=True)):
+            out[i] = _error_draft(urls[i], r) if isinstance(r, BaseException) else r
+
+    async def _batches() -> None:
+        results = await asyncio.gather(*[_batch(s, ids) for s, ids in batched.items()])
+        for ids, res in zip(batched.values(), results):
+            for i, r in zip(ids, res):
+                out[i] = _error_draft(urls[i], r) if isinstance(r, BaseException) else r
+
+    groups = [asyncio.ensure_future(_own()), asyncio.ensure_future(_batches())]
+    if generic:
+        groups.append(asyncio.ensure_future(_parse_generic(urls, generic, concurrency, out)))
+    try:
+        await asyncio.gather(*groups)
+    finally:
+        # if one group failed, don't leave the others running unobserved
+        for t in groups:
+            t.cancel()
+        await asyncio.gather(*groups, return_exceptions=True)
+        pool.shutdown(wait=False, cancel_futures=True)
+        # the httpx client belongs to this (asyncio.run) loop, which ends with us
+        await close_client()
+
     return out
+
+def scrape_products(urls: List[str], concurrency: int = 8) -> List[ProductDraft]:
+    return asyncio.run(scrape_products_async(urls, concurrency=concurrency))
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+# One long-lived event loop for the sync scraper entry points. asyncio.run() per URL
+# would build and drop a loop each time, and with it the loop-bound pooled Chromium.
+_loop = asyncio.new_event_loop()
+threading.Thread(target=_loop.run_forever, name="scraper-loop", daemon=True).start()
+
+
+def run(coro):
+    """Run coro on the shared loop and block until it finishes (safe from any thread but the loop's own)."""
+    return asyncio.run_coroutine_threadsafe(coro, _loop).result()
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import json
+import os
+from copy import deepcopy
+from functools import lru_cache
+
+import lxml.html
+from lxml import etree
+from lxml.cssselect import CSSSelector
+
+from ..utils import clean_text
+
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is the fallback
+    orjson = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# Scrapers parse with Lexbor (selectolax, C HTML5 parser) by default;
+# SCRAPER_HTML_BACKEND=lxml switches back to lxml if a page trips Lexbor up.
+USE_LEXBOR = LexborHTMLParser is not None and os.environ.get("SCRAPER_HTML_BACKEND", "lexbor") != "lxml"
+
+# Never part of the visible text (BeautifulSoup's get_text() skips them too); embedded
+# JSON (JSON-LD, __NEXT_DATA__) is read from the raw HTML, so they are dropped at parse time.
+_INVISIBLE_TAGS = ["script", "style", "template"]
+
+# Page HTML is always handed over as str; feed it as UTF-8 bytes so a
+# <?xml encoding=...?> / <meta charset> declaration can't make lxml reject it.
+_HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+_XP_TEXT = etree.XPath(".//text()", smart_strings=False)
+_css_lxml = lru_cache(maxsize=None)(CSSSelector)
+
+
+def parse_html(html: str):
+    """Parse a whole page once; every extractor then queries the same tree."""
+    if USE_LEXBOR:
+        tree = LexborHTMLParser(html or "")
+        tree.strip_tags(_INVISIBLE_TAGS)
+        return tree
+    try:
+        root = lxml.html.document_fromstring((html or "").encode("utf-8", "replace"), parser=_HTML_PARSER)
+    except etree.ParserError:
+        # empty / whitespace-only document
+        root = lxml.html.document_fromstring(b"<html><body></body></html>", parser=_HTML_PARSER)
+    etree.strip_elements(root, *_INVISIBLE_TAGS, with_tail=False)
+    return root
+
+
+def css_all(node, sel: str) -> list:
+    if USE_LEXBOR:
+        return node.css(sel)
+    return _css_lxml(sel)(node)
+
+
+def css_one(node, sel: str):
+    if USE_LEXBOR:
+        return node.css_first(sel)
+    found = _css_lxml(sel)(node)
+    return found[0] if found else None
+
+
+def attr(node, name: str) -> str | None:
+    if USE_LEXBOR:
+        return node.attributes.get(name)
+    return node.get(name)
+
+
+def get_text(node, sep: str = "", strip: bool = False) -> str:
+    """Text of node and its descendants; with strip, each piece is stripped and empties dropped."""
+    if USE_LEXBOR:
+        if isinstance(node, LexborHTMLParser):
+            node = node.root  # whole page, <head> included (as with lxml / BeautifulSoup)
+        if not sep and not strip:
+            return node.text()
+        # Lexbor's own separator/strip keep empty pieces and add a trailing separator;
+        # NUL never survives HTML parsing, so it is a safe piece delimiter.
+        parts = node.text(separator="\x00").split("\x00")
+        if parts and not parts[-1]:
+            parts.pop()
+        if not strip:
+            return sep.join(parts)
+    else:
+        parts = _XP_TEXT(node)
+        if not strip:
+            return sep.join(parts)
+    parts = [t.strip() for t in parts]
+    return sep.join([t for t in parts if t])
+
+
+def outer_html(node) -> str:
+    if USE_LEXBOR:
+        return node.html
+    return lxml.html.tostring(node, encoding="unicode", with_tail=False)
+
+
+def clone(tree):
+    """Independent copy of a parsed page, for extractors that delete nodes."""
+    if USE_LEXBOR:
+        return tree.clone()
+    return deepcopy(tree)
+
+
+def drop(node) -> None:
+    """Remove node and its subtree, keeping the text that follows it."""
+    if USE_LEXBOR:
+        node.decompose()
+    else:
+        node.drop_tree()
+
+
+def fragment_text(html: str) -> str:
+    """Plain text of an HTML snippet we built ourselves (e.g. a description)."""
+    if not html:
+        return ""
+    frag = lxml.html.fragment_fromstring(html, create_parent="div")
+    return etree.tostring(frag, method="text", encoding="unicode")
+
+
+def short_text(desc_html: str, desc_text: str, limit: int = 200) -> str:
+    """short_description from the plain text we wrapped into desc_html.
+
+    Falls back to reading desc_html only when that text itself carries markup/entities
+    (e.g. a JSON-LD description with <br>), where the tags must not leak through.
+    """
+    if "<" in desc_text or "&" in desc_text:
+        desc_text = fragment_text(desc_html)
+    return clean_text(desc_text)[:limit]
+
+
+def loads_json(raw: str):
+    """Decode embedded JSON (JSON-LD, __NEXT_DATA__) with orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # stdlib json is laxer (NaN / Infinity literals); give it a go before giving up
+            pass
+    return json.loads(raw)
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import asyncio
+import atexit
+
+from playwright.async_api import async_playwright
+
+# Playwright objects are bound to the event loop that created them, so the pool keeps
+# one Chromium per loop; callers create (and close) a cheap BrowserContext per request.
+_POOLS: dict = {}
+
+_LAUNCH_ARGS = ["--no-sandbox", "--disable-dev-shm-usage", "--disable-blink-features=AutomationControlled"]
+
+
+class _Pool:
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.pw = None
+        self.browser = None
+
+
+async def get_browser():
+    """Shared headless Chromium for the running event loop (launched on first use)."""
+    loop = asyncio.get_running_loop()
+    pool = _POOLS.get(loop)
+    if pool is None:
+        pool = _POOLS[loop] = _Pool()
+    async with pool.lock:
+        if pool.browser is None or not pool.browser.is_connected():
+            if pool.pw is None:
+                pool.pw = await async_playwright().start()
+            try:
+                pool.browser = await pool.pw.chromium.launch(headless=True, args=_LAUNCH_ARGS)
+            except Exception:
+                # the driver keeps the environment it started with (PLAYWRIGHT_BROWSERS_PATH);
+                # drop it so a retry after installing Chromium starts a fresh one
+                pw, pool.pw, pool.browser = pool.pw, None, None
+                try:
+                    await pw.stop()
+                except Exception:
+                    pass
+                raise
+    return pool.browser
+
+
+async def _close_pool(pool: _Pool) -> None:
+    try:
+        if pool.browser is not None:
+            await pool.browser.close()
+    finally:
+        if pool.pw is not None:
+            await pool.pw.stop()
+
+
+async def close_browser() -> None:
+    """Close the running loop's browser; call before tearing that loop down."""
+    pool = _POOLS.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        await _close_pool(pool)
+
+
+@atexit.register
+def _close_at_exit() -> None:
+    for loop, pool in list(_POOLS.items()):
+        if loop.is_closed():
+            continue
+        try:
+            if loop.is_running():
+                asyncio.run_coroutine_threadsafe(_close_pool(pool), loop).result(timeout=10)
+            else:
+                loop.run_until_complete(_close_pool(pool))
+        except Exception:
+            pass
+    _POOLS.clear()
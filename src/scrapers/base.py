@@ -3,6 +3,9 @@ from abc import ABC, abstractmethod
 from ..models import ProductDraft
 
 class Scraper(ABC):
+    # host suffixes this scraper owns (e.g. "pfconcept.com"); used by the registry lookup
+    DOMAINS: tuple[str, ...] = ()
+
     @abstractmethod
     def can_handle(self, url: str) -> bool:
         ...
@@ -1,11 +1,9 @@
 from __future__ import annotations
 
-import json
 import re
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
-
+from ._parse import attr, css_all, css_one, get_text, loads_json, outer_html, parse_html, short_text
 from .base import Scraper
 from ..browser import render_html_sync
 from ..fetch import fetch_html
@@ -13,101 +11,123 @@ from ..models import ProductDraft
 from ..utils import clean_text, domain_of, ensure_sku
 
 
-def _extract_images_basic(soup: BeautifulSoup, base_url: str) -> list[str]:
-    imgs: list[str] = []
-    for img in soup.select("img"):
-        src = img.get("src") or img.get("data-src") or img.get("data-original")
+_TITLE_META = ['meta[property="og:title"]', 'meta[name="twitter:title"]']
+_DESC_META = [
+    'meta[property="og:description"]',
+    'meta[name="description"]',
+    'meta[name="twitter:description"]',
+]
+_DESC_SELECTORS = [
+    '[itemprop="description"]',
+    ".product-description",
+    ".description",
+    "#description",
+    ".tab-content",
+    ".product-tabs",
+    ".product__description",
+]
+_SKU_SELECTORS = ['[itemprop="sku"]', ".sku", ".product-sku", "#sku"]
+# JSON-LD is read straight from the raw HTML (script bodies are raw text, no entity
+# decoding), so JSON-LD-rich pages never need the full DOM.
+_JSONLD_RE = re.compile(
+    r"""<script\b[^>]*\btype\s*=\s*["']?application/ld\+json["']?[^>]*>(.*?)</script\s*>""",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def _extract_images_basic(root, base_url: str) -> list[str]:
+    # dict as an insertion-ordered set; stop as soon as we have 12 distinct URLs
+    seen: dict[str, None] = {}
+    for img in css_all(root, "img"):
+        src = attr(img, "src") or attr(img, "data-src") or attr(img, "data-original")
         if not src:
             continue
         src = urljoin(base_url, src)
-        if src.lower().startswith("data:"):
+        low = src.lower()
+        if low.startswith("data:") or "logo" in low or "icon" in low or "sprite" in low:
             continue
-        if any(x in src.lower() for x in ["logo", "icon", "sprite"]):
+        if src in seen:
             continue
-        imgs.append(src)
-
-    seen = set()
-    out: list[str] = []
-    for u in imgs:
-        if u not in seen:
-            seen.add(u)
-            out.append(u)
-    return out[:12]
+        seen[src] = None
+        if len(seen) == 12:
+            break
+    return list(seen)
 
 
-def _meta_content(soup: BeautifulSoup, selectors: list[str]) -> str:
+def _meta_content(root, selectors: list[str]) -> str:
     for sel in selectors:
-        el = soup.select_one(sel)
-        if el and el.get("content") and clean_text(el.get("content")):
-            return clean_text(el.get("content"))
+        el = css_one(root, sel)
+        if el is None:
+            continue
+        c = attr(el, "content")
+        if not c:
+            continue
+        cleaned = clean_text(c)
+        if cleaned:
+            return cleaned
     return ""
 
 
-def _extract_title_basic(soup: BeautifulSoup) -> str:
-    og = _meta_content(soup, ['meta[property="og:title"]', 'meta[name="twitter:title"]'])
+def _extract_title_basic(root) -> str:
+    og = _meta_content(root, _TITLE_META)
     if og:
         return og
-    h1 = soup.select_one("h1")
-    if h1 and clean_text(h1.get_text()):
-        return clean_text(h1.get_text())
-    if soup.title and clean_text(soup.title.get_text()):
-        return clean_text(soup.title.get_text())
+    for tag in ("h1", "title"):
+        el = css_one(root, tag)
+        if el is not None:
+            cleaned = clean_text(get_text(el))
+            if cleaned:
+                return cleaned
     return "Produs"
 
 
-def _extract_price_basic(soup: BeautifulSoup) -> float | None:
-    text = soup.get_text(" ", strip=True)
-    m = re.search(r"(\d+[\.,]?\d*)\s*(lei|ron|eur|€)", text, re.IGNORECASE)
+# Runs on the raw HTML: the amount must sit in a text run (after a ">"), so attribute
+# values don't match; currency may follow after whitespace, &nbsp; or inline tags.
+# <script>/<style> blocks match the first branch and are skipped whole.
+_PRICE_RE = re.compile(
+    r"<(script|style)\b.*?</\1\s*>"
+    r"|>[^<]*?(\d+[\.,]?\d*)(?:\s|&nbsp;|&#160;|<[^>]+>)*(?:lei|ron|eur|€|&euro;)",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def _extract_price_basic(html: str) -> float | None:
+    m = next((m for m in _PRICE_RE.finditer(html) if m.group(2)), None)
     if not m:
         return None
-    val = m.group(1).replace(".", "").replace(",", ".")
+    val = m.group(2).replace(".", "").replace(",", ".")
     try:
         return float(val)
     except Exception:
         return None
 
 
-def _extract_desc_basic(soup: BeautifulSoup) -> str:
-    ogd = _meta_content(
-        soup,
-        [
-            'meta[property="og:description"]',
-            'meta[name="description"]',
-            'meta[name="twitter:description"]',
-        ],
-    )
+def _extract_desc_basic(root) -> tuple[str, str]:
+    """(description html, its plain text)."""
+    ogd = _meta_content(root, _DESC_META)
     if ogd and len(ogd) > 40:
-        return f"<p>{ogd}</p>"
-
-    for sel in [
-        '[itemprop="description"]',
-        ".product-description",
-        ".description",
-        "#description",
-        ".tab-content",
-        ".product-tabs",
-        ".product__description",
-    ]:
-        el = soup.select_one(sel)
-        if el and len(el.get_text(strip=True)) > 50:
-            return str(el)
-
-    ps = soup.find_all(["p", "div"])
+        return f"<p>{ogd}</p>", ogd
+
+    for sel in _DESC_SELECTORS:
+        el = css_one(root, sel)
+        if el is not None and len(get_text(el, strip=True)) > 50:
+            return outer_html(el), get_text(el)
+
     best = ""
-    for p in ps:
-        t = p.get_text(" ", strip=True)
+    for p in css_all(root, "p, div"):
+        t = get_text(p, " ", strip=True)
         if len(t) > len(best) and len(t) > 80:
             best = t
-    return f"<p>{best}</p>" if best else ""
+    return (f"<p>{best}</p>", best) if best else ("", "")
 
 
-def _iter_jsonld_objects(soup: BeautifulSoup):
-    for sc in soup.select('script[type="application/ld+json"]'):
-        raw = (sc.string or sc.get_text() or "").strip()
+def _iter_jsonld_objects(html: str):
+    for m in _JSONLD_RE.finditer(html):
+        raw = m.group(1).strip()
         if not raw:
             continue
         try:
-            data = json.loads(raw)
+            data = loads_json(raw)
         except Exception:
             continue
         if isinstance(data, dict):
@@ -118,8 +138,8 @@ def _iter_jsonld_objects(soup: BeautifulSoup):
                     yield obj
 
 
-def _find_product_jsonld(soup: BeautifulSoup) -> dict | None:
-    for obj in _iter_jsonld_objects(soup):
+def _find_product_jsonld(html: str) -> dict | None:
+    for obj in _iter_jsonld_objects(html):
         t = obj.get("@type") or obj.get("type")
         if isinstance(t, list) and "Product" in t:
             return obj
@@ -164,31 +184,30 @@ def _jsonld_get_price(prod: dict) -> float | None:
     return None
 
 
+# One case-insensitive scan instead of lowercasing the whole (often 500KB+) page per marker.
+_BLOCKED_RE = re.compile(
+    r"enable javascript|attention required|access denied|captcha|cloudflare|cookie|consent"
+    r"|please enable|for full functionality of this site",
+    re.IGNORECASE,
+)
+
+
+def needs_render(html: str) -> bool:
+    """True when the plain HTTP response looks blocked / JS-only and needs Playwright."""
+    return len(html) < 1500 or _BLOCKED_RE.search(html) is not None
+
+
 class GenericScraper(Scraper):
     def can_handle(self, url: str) -> bool:
         return True
 
     def parse(self, url: str) -> ProductDraft:
-        domain = domain_of(url)
         html, method = fetch_html(url)
 
-        blocked_markers = [
-            "enable javascript",
-            "attention required",
-            "access denied",
-            "captcha",
-            "cloudflare",
-            "cookie",
-            "cookies",
-            "consent",
-            "please enable",
-            "for full functionality of this site",
-        ]
-
         tried_playwright = False
         pw_error = ""
 
-        if len(html) < 1500 or any(mark in html.lower() for mark in blocked_markers):
+        if needs_render(html):
             tried_playwright = True
             try:
                 html = render_html_sync(url, wait_ms=2500)
@@ -196,11 +215,24 @@ class GenericScraper(Scraper):
             except Exception as e:
                 pw_error = f"playwright_failed={type(e).__name__}: {e}"
 
-        soup = BeautifulSoup(html, "lxml")
-        prod = _find_product_jsonld(soup)
+        return self.parse_html(url, html, method, tried_playwright=tried_playwright, pw_error=pw_error)
+
+    def parse_html(
+        self,
+        url: str,
+        html: str,
+        method: str,
+        tried_playwright: bool = False,
+        pw_error: str = "",
+    ) -> ProductDraft:
+        """Build the draft from already fetched HTML (used directly by the batch pipeline)."""
+        domain = domain_of(url)
+
+        prod = _find_product_jsonld(html)
 
         title = None
         desc_html = None
+        desc_text = ""
         images = None
         sku = None
         price = None
@@ -210,25 +242,30 @@ class GenericScraper(Scraper):
             sku = clean_text(str(prod.get("sku") or "")) or None
             d = prod.get("description")
             if isinstance(d, str) and clean_text(d):
-                desc_html = f"<p>{clean_text(d)}</p>"
+                desc_text = clean_text(d)
+                desc_html = f"<p>{desc_text}</p>"
             images = _jsonld_get_images(prod) or None
             price = _jsonld_get_price(prod)
 
+        # build the DOM only for what JSON-LD didn't provide (the price fallback scans raw HTML)
+        root = parse_html(html) if not (title and desc_html and images is not None and sku) else None
+
         if not title:
-            title = _extract_title_basic(soup)
+            title = _extract_title_basic(root)
         if not desc_html:
-            desc_html = _extract_desc_basic(soup)
+            desc_html, desc_text = _extract_desc_basic(root)
         if images is None:
-            images = _extract_images_basic(soup, url)
+            images = _extract_images_basic(root, url)
         if price is None:
-            price = _extract_price_basic(soup)
+            price = _extract_price_basic(html)
 
         if not sku:
-            for sel in ['[itemprop="sku"]', ".sku", ".product-sku", "#sku"]:
-                el = soup.select_one(sel)
-                if el and clean_text(el.get_text()):
-                    sku = clean_text(el.get_text())
-                    break
+            for sel in _SKU_SELECTORS:
+                el = css_one(root, sel)
+                if el is not None:
+                    sku = clean_text(get_text(el)) or None
+                    if sku:
+                        break
 
         notes_parts = ["generic=v6-safe", f"parsed_with={method}"]
         if tried_playwright and method != "playwright":
@@ -242,7 +279,7 @@ class GenericScraper(Scraper):
             sku=ensure_sku(url, sku),
             title=title,
             description_html=desc_html or "",
-            short_description=clean_text(BeautifulSoup(desc_html or "", "lxml").get_text())[:200],
+            short_description=short_text(desc_html or "", desc_text),
             images=images or [],
             price=price,
             currency="RON",
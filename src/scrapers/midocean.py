@@ -4,12 +4,14 @@ from .generic import GenericScraper
 from ..utils import domain_of
 
 class MidOceanScraper(Scraper):
+    DOMAINS = ("midocean.com",)
+
     def __init__(self):
         self._g = GenericScraper()
 
     def can_handle(self, url: str) -> bool:
         d = domain_of(url)
-        return any(d.endswith(x) for x in ['midocean.com'])
+        return any(d.endswith(x) for x in self.DOMAINS)
 
     def parse(self, url: str):
         draft = self._g.parse(url)
@@ -1,17 +1,20 @@
 from __future__ import annotations
 
-import asyncio
-from playwright.async_api import async_playwright
+from ._loop import run
+from ._pw_pool import get_browser
+from ..browser import _block_heavy
 
 async def _fetch(url: str, wait_ms: int = 2500) -> str:
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page()
+    browser = await get_browser()
+    context = await browser.new_context()
+    await context.route("**/*", _block_heavy)
+    try:
+        page = await context.new_page()
         await page.goto(url, wait_until="domcontentloaded", timeout=60000)
         await page.wait_for_timeout(wait_ms)
-        html = await page.content()
-        await browser.close()
-        return html
+        return await page.content()
+    finally:
+        await context.close()
 
 def fetch_html_playwright(url: str, wait_ms: int = 2500) -> str:
-    return asyncio.run(_fetch(url, wait_ms=wait_ms))
+    return run(_fetch(url, wait_ms=wait_ms))
@@ -1,18 +1,17 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import os
 import re
-import subprocess
-import sys
 from typing import Any
-from urllib.parse import urljoin
-
-from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright
+from urllib.parse import urljoin, urlsplit
 
+from ._parse import attr, clone, css_all, css_one, drop, get_text, loads_json, parse_html, short_text
+from ._loop import run
+from ._pw_pool import get_browser
 from .base import Scraper
+from ..browser import _block_heavy, _ensure_playwright_chromium_installed, _looks_blocked
+from ..cache import get_html, put_html
 from ..models import ProductDraft
 from ..utils import clean_text, domain_of, ensure_sku
 
@@ -20,108 +19,121 @@ from ..utils import clean_text, domain_of, ensure_sku
 LOGIN_URL = "https://psiproductfinder.de/login"
 
 
-def _pw_writable_browsers_path() -> str:
-    home = os.path.expanduser("~")
-    return os.path.join(home, ".cache", "ms-playwright")
-
-
-def _ensure_playwright_chromium_installed() -> None:
-    """Ensure Playwright Chromium exists (Streamlit Cloud safe path)."""
-    if os.environ.get("PW_CHROMIUM_READY") == "1":
-        return
-    browsers_path = _pw_writable_browsers_path()
-    os.makedirs(browsers_path, exist_ok=True)
-    os.environ["PLAYWRIGHT_BROWSERS_PATH"] = browsers_path
-
-    proc = subprocess.run(
-        [sys.executable, "-m", "playwright", "install", "chromium"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
-    )
-    if proc.returncode != 0:
-        raise RuntimeError(f"playwright_install_failed (code={proc.returncode}):\n{proc.stdout}")
-    os.environ["PW_CHROMIUM_READY"] = "1"
+# Script bodies are raw text, so the Next.js state is read from the HTML before parsing.
+_NEXT_DATA_RE = re.compile(
+    r"""<script\b[^>]*\bid\s*=\s*["']?__NEXT_DATA__["']?[^>]*>(.*?)</script\s*>""",
+    re.IGNORECASE | re.DOTALL,
+)
 
 
-def _meta(soup: BeautifulSoup, key: str) -> str:
-    el = soup.select_one(f'meta[property="{key}"]') or soup.select_one(f'meta[name="{key}"]')
-    if el and el.get("content"):
-        return clean_text(el.get("content"))
+def _meta(root, key: str) -> str:
+    el = css_one(root, f'meta[property="{key}"]')
+    if el is None:
+        el = css_one(root, f'meta[name="{key}"]')
+    c = attr(el, "content") if el is not None else None
+    if c:
+        return clean_text(c)
     return ""
 
 
-def _extract_images(soup: BeautifulSoup, base_url: str) -> list[str]:
-    urls: list[str] = []
-    for m in soup.select('meta[property="og:image"], meta[property="og:image:secure_url"], meta[name="twitter:image"]'):
-        c = m.get("content")
+def _extract_images(root, base_url: str) -> list[str]:
+    # dict as an insertion-ordered set; stop as soon as we have 12 distinct URLs
+    seen: dict[str, None] = {}
+    for m in css_all(root, 'meta[property="og:image"], meta[property="og:image:secure_url"], meta[name="twitter:image"]'):
+        c = attr(m, "content")
         if c:
-            urls.append(urljoin(base_url, c))
+            seen[urljoin(base_url, c)] = None
+            if len(seen) == 12:
+                return list(seen)
 
-    for img in soup.select("img"):
-        src = img.get("src") or img.get("data-src") or img.get("data-original") or img.get("data-lazy")
+    for img in css_all(root, "img"):
+        src = attr(img, "src") or attr(img, "data-src") or attr(img, "data-original") or attr(img, "data-lazy")
         if not src:
-            srcset = img.get("srcset") or img.get("data-srcset")
+            srcset = attr(img, "srcset") or attr(img, "data-srcset")
             if srcset:
                 src = srcset.split(",")[-1].strip().split(" ")[0]
         if not src:
             continue
         src = urljoin(base_url, src)
-        if src.lower().startswith("data:"):
+        low = src.lower()
+        if low.startswith("data:") or "logo" in low or "icon" in low or "sprite" in low:
             continue
-        if any(x in src.lower() for x in ["logo", "icon", "sprite"]):
+        if src in seen:
             continue
-        urls.append(src)
-
-    seen = set()
-    out = []
-    for u in urls:
-        if u not in seen:
-            seen.add(u)
-            out.append(u)
-    return out[:12]
-
-
-def _find_first(obj: Any, keys: set[str]) -> str | None:
-    if isinstance(obj, dict):
-        for k, v in obj.items():
-            if k in keys and isinstance(v, str) and clean_text(v):
-                return clean_text(v)
-        for v in obj.values():
-            r = _find_first(v, keys)
-            if r:
-                return r
-    elif isinstance(obj, list):
-        for it in obj:
-            r = _find_first(it, keys)
-            if r:
-                return r
-    return None
-
-
-def _parse_next_data(soup: BeautifulSoup) -> dict | None:
-    sc = soup.select_one("script#__NEXT_DATA__")
-    if not sc:
+        seen[src] = None
+        if len(seen) == 12:
+            break
+    return list(seen)
+
+
+_STATE_TARGETS = {
+    "title": frozenset({"name", "title", "productName", "product_title"}),
+    "desc": frozenset({"description", "longDescription", "shortDescription", "productDescription", "text"}),
+}
+
+
+def _find_many(obj: Any, targets: dict[str, frozenset[str]]) -> dict[str, str | None]:
+    """First non-empty string per target key set, in one walk over the tree.
+
+    Same pick as a recursive search per target: a dict's own keys win over its
+    descendants, and children are visited depth-first in order (explicit stack,
+    so no Python recursion on deep __NEXT_DATA__ payloads).
+    """
+    found: dict[str, str | None] = dict.fromkeys(targets)
+    all_keys = frozenset().union(*targets.values())
+    missing = len(targets)
+    stack = [obj]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for k, v in node.items():
+                if k not in all_keys or not isinstance(v, str):
+                    continue
+                for name, keys in targets.items():
+                    if found[name] is None and k in keys:
+                        c = clean_text(v)
+                        if c:
+                            found[name] = c
+                            missing -= 1
+            if not missing:
+                break
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+    return found
+
+
+def _parse_next_data(html: str) -> dict | None:
+    m = _NEXT_DATA_RE.search(html)
+    if not m:
         return None
-    raw = (sc.string or sc.get_text() or "").strip()
+    raw = m.group(1).strip()
     if not raw:
         return None
     try:
-        return json.loads(raw)
+        return loads_json(raw)
     except Exception:
         return None
 
 
-_UNWANTED_RE = re.compile(
-    r"\b(previous|next|angebot\s+anfragen|kontakt|anmelden|login|preise?|produktfinder|men[üu]|suche|produkt\s*details|konfigurieren|warenkorb)\b",
-    flags=re.I,
+_WS_RE = re.compile(r"\s+")
+_UNWANTED_WORDS = (
+    r"previous|next|angebot\s+anfragen|kontakt|anmelden|login|preise?|produktfinder|men[üu]|suche|produkt\s*details|konfigurieren|warenkorb"
 )
+try:
+    import re2
+
+    # RE2 matches in linear time; its \b is ASCII-only though ("menü" would never
+    # match), so spell out the Unicode word boundary that `re` gives us.
+    _UNWANTED_RE = re2.compile(r"(?i)(?:^|[^\pL\pN_])(?:" + _UNWANTED_WORDS + r")(?:[^\pL\pN_]|$)")
+except ImportError:
+    _UNWANTED_RE = re.compile(r"\b(" + _UNWANTED_WORDS + r")\b", flags=re.I)
 
 
 def _clean_paragraphs(paras: list[str]) -> list[str]:
     out: list[str] = []
     for p in paras:
-        p = re.sub(r"\s+", " ", p).strip()
+        p = _WS_RE.sub(" ", p).strip()
         if not p or len(p) < 40:
             continue
         if _UNWANTED_RE.search(p):
@@ -139,34 +151,38 @@ def _clean_paragraphs(paras: list[str]) -> list[str]:
     return dedup
 
 
-def _best_description_html(soup: BeautifulSoup) -> str:
-    s2 = BeautifulSoup(str(soup), "lxml")
-    for sel in [
-        "nav", "header", "footer", "aside", "form", "button",
-        ".breadcrumb", ".breadcrumbs", ".pagination", ".pager", ".nav",
-        ".header", ".footer", ".sidebar", ".cookie", ".consent", ".modal",
-    ]:
-        for el in s2.select(sel):
-            el.decompose()
-
-    selectors = [
-        "[itemprop=description]",
-        ".description",
-        ".product-description",
-        ".product__description",
-        ".productDetail",
-        ".product-detail",
-        ".content",
-        "main",
-        "article",
-        "[role=main]",
-    ]
+_CHROME_SELECTORS = [
+    "nav", "header", "footer", "aside", "form", "button",
+    ".breadcrumb", ".breadcrumbs", ".pagination", ".pager", ".nav",
+    ".header", ".footer", ".sidebar", ".cookie", ".consent", ".modal",
+]
+_DESC_ROOT_SELECTORS = [
+    "[itemprop=description]",
+    ".description",
+    ".product-description",
+    ".product__description",
+    ".productDetail",
+    ".product-detail",
+    ".content",
+    "main",
+    "article",
+    "[role=main]",
+]
+
+
+def _best_description_html(root) -> tuple[str, str]:
+    """(description html, its plain text)."""
+    # work on a copy so the caller's tree keeps its nav/header/... for other extractors
+    s2 = clone(root)
+    for sel in _CHROME_SELECTORS:
+        for el in css_all(s2, sel):
+            drop(el)
 
     paras: list[str] = []
-    for sel in selectors:
-        for root in s2.select(sel):
-            for p in root.select("p, li"):
-                txt = p.get_text(" ", strip=True)
+    for sel in _DESC_ROOT_SELECTORS:
+        for el in css_all(s2, sel):
+            for p in css_all(el, "p, li"):
+                txt = get_text(p, " ", strip=True)
                 if txt:
                     paras.append(txt)
         if len(paras) >= 5:
@@ -175,12 +191,12 @@ def _best_description_html(soup: BeautifulSoup) -> str:
     paras = _clean_paragraphs(paras)
 
     if not paras:
-        text = s2.get_text("\n", strip=True)
+        text = get_text(s2, "\n", strip=True)
         chunks = [c.strip() for c in text.split("\n") if c.strip()]
         paras = _clean_paragraphs(chunks)
 
     if not paras:
-        return ""
+        return "", ""
 
     out_paras = []
     total = 0
@@ -190,13 +206,30 @@ def _best_description_html(soup: BeautifulSoup) -> str:
         out_paras.append(p)
         total += len(p)
 
-    return "".join([f"<p>{p}</p>" for p in out_paras])
+    return "".join([f"<p>{p}</p>" for p in out_paras]), "".join(out_paras)
+
+
+_AT_BOTTOM_JS = "window.innerHeight + window.scrollY >= document.body.scrollHeight - 100"
 
 
 async def _auto_scroll(page, steps: int = 10, step_px: int = 900, wait_ms: int = 200):
+    """Wheel down to trigger lazy content; stop as soon as the bottom is reached."""
     for _ in range(steps):
         await page.mouse.wheel(0, step_px)
-        await page.wait_for_timeout(wait_ms)
+        try:
+            await page.wait_for_function(_AT_BOTTOM_JS, timeout=wait_ms)
+            return
+        except Exception:
+            # not at the bottom yet (or the page grew): keep scrolling
+            continue
+
+
+async def _settle(page, timeout_ms: int) -> None:
+    """Wait for network idle, but never longer than timeout_ms."""
+    try:
+        await page.wait_for_load_state("networkidle", timeout=timeout_ms)
+    except Exception:
+        pass
 
 
 async def _accept_cookies_if_any(page):
@@ -212,155 +245,175 @@ async def _accept_cookies_if_any(page):
             btn = await page.query_selector(sel)
             if btn:
                 await btn.click()
-                await page.wait_for_timeout(300)
+                try:
+                    await btn.wait_for_element_state("hidden", timeout=1000)
+                except Exception:
+                    pass
                 return
         except Exception:
             continue
 
 
-async def _fetch_with_login(url: str, user: str, password: str, wait_ms: int = 1600) -> tuple[str, str]:
-    try:
-        async with async_playwright() as pw:
-            browser = await pw.chromium.launch(
-                headless=True,
-                args=["--no-sandbox", "--disable-dev-shm-usage", "--disable-blink-features=AutomationControlled"],
-            )
-            context = await browser.new_context(
-                user_agent=(
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/122.0.0.0 Safari/537.36"
-                ),
-                locale="de-DE",
-                extra_http_headers={"Accept-Language": "de-DE,de;q=0.9,en-US;q=0.8,en;q=0.7"},
-                viewport={"width": 1366, "height": 768},
-            )
-            page = await context.new_page()
-            await page.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined});")
+# the product page is usable once one of these is in the DOM; wait_ms only caps the wait
+_CONTENT_SELECTOR = "[itemprop=description], .description, .product-description"
 
-            note_parts = ["psi_pw=YES"]
+# storage_state of a logged-in session, per PSI user, so later pages skip the login form
+_STATE: dict[str, dict] = {}
+# parse_batch fetches pages concurrently; only the first one per user should log in
+_LOGIN_LOCKS: dict[str, asyncio.Lock] = {}
 
-            if user and password:
-                await page.goto(LOGIN_URL, wait_until="domcontentloaded", timeout=60000)
-                await page.wait_for_timeout(600)
-                await _accept_cookies_if_any(page)
 
-                await page.fill('input[name="username"], input[id*="user" i], input[placeholder*="Benutzername" i], input[type="text"]', user)
-                await page.fill('input[name="password"], input[id*="pass" i], input[placeholder*="Passwort" i], input[type="password"]', password)
+async def _login(page, user: str, password: str) -> None:
+    await page.goto(LOGIN_URL, wait_until="domcontentloaded", timeout=60000)
+    await _accept_cookies_if_any(page)
+
+    await page.fill('input[name="username"], input[id*="user" i], input[placeholder*="Benutzername" i], input[type="text"]', user)
+    await page.fill('input[name="password"], input[id*="pass" i], input[placeholder*="Passwort" i], input[type="password"]', password)
+
+    try:
+        await page.click('button:has-text("LOGIN"), button[type="submit"], input[type="submit"]', timeout=8000)
+    except Exception:
+        await page.keyboard.press("Enter")
+
+    try:
+        await page.wait_for_url(lambda u: "/login" not in u.lower(), timeout=10000)
+    except Exception:
+        # still on /login (e.g. wrong credentials): carry on, the page fetch will show it
+        pass
+    await _settle(page, 3000)
+    await _accept_cookies_if_any(page)
+
+
+async def _route(route):
+    # like XDConnects: the cookie banner and login form need PSI's own CSS to be clickable,
+    # so first-party stylesheets load; everything else goes through the usual blocking
+    request = route.request
+    if request.resource_type == "stylesheet" and (urlsplit(request.url).hostname or "").endswith("psiproductfinder.de"):
+        await route.continue_()
+    else:
+        await _block_heavy(route)
+
+
+async def _new_context(browser, storage_state: dict | None):
+    context = await browser.new_context(
+        user_agent=(
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+            "AppleWebKit/537.36 (KHTML, like Gecko) "
+            "Chrome/122.0.0.0 Safari/537.36"
+        ),
+        locale="de-DE",
+        extra_http_headers={"Accept-Language": "de-DE,de;q=0.9,en-US;q=0.8,en;q=0.7"},
+        viewport={"width": 1366, "height": 768},
+        storage_state=storage_state,
+    )
+    await context.route("**/*", _route)
+    await context.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined});")
+    return context
+
+
+async def _ensure_login(browser, user: str, password: str) -> bool:
+    """Log `user` in once and keep the session in _STATE; True if this call did the login."""
+    lock = _LOGIN_LOCKS.setdefault(user, asyncio.Lock())
+    async with lock:
+        if user in _STATE:
+            return False
+        context = await _new_context(browser, None)
+        try:
+            page = await context.new_page()
+            await _login(page, user, password)
+            _STATE[user] = await context.storage_state()
+        finally:
+            await context.close()
+        return True
 
-                try:
-                    await page.click('button:has-text("LOGIN"), button[type="submit"], input[type="submit"]', timeout=8000)
-                except Exception:
-                    await page.keyboard.press("Enter")
 
-                await page.wait_for_timeout(1200)
-                await _accept_cookies_if_any(page)
-                note_parts.append("psi_login=YES")
-            else:
-                note_parts.append("psi_login=NO")
+async def _do_fetch(url: str, user: str, password: str, wait_ms: int, extra_notes: tuple[str, ...] = ()) -> tuple[str, str]:
+    browser = await get_browser()
+    note_parts = ["psi_pw=YES", *extra_notes]
+    if user and password:
+        note_parts.append("psi_login=YES" if await _ensure_login(browser, user, password) else "psi_login=REUSED")
+    else:
+        note_parts.append("psi_login=NO")
 
+    context = await _new_context(browser, _STATE.get(user) if user else None)
+    try:
+        page = await context.new_page()
+        await page.goto(url, wait_until="domcontentloaded", timeout=60000)
+        if user and password and "/login" in page.url:
+            # saved session expired: log in again and retry the product page
+            await _login(page, user, password)
+            _STATE[user] = await context.storage_state()
+            note_parts.append("psi_relogin=YES")
             await page.goto(url, wait_until="domcontentloaded", timeout=60000)
-            await page.wait_for_timeout(wait_ms)
-            await _auto_scroll(page, steps=10, step_px=900, wait_ms=180)
-            await page.wait_for_timeout(500)
+        try:
+            await page.wait_for_selector(_CONTENT_SELECTOR, timeout=wait_ms)
+        except Exception:
+            pass
+        await _auto_scroll(page, steps=10, step_px=900, wait_ms=180)
+        await _settle(page, 500)
+        if "/login" in page.url:
+            # login failed (or a members-only page without credentials): not worth caching
+            note_parts.append("psi_on_login=YES")
 
-            html = await page.content()
-            await context.close()
-            await browser.close()
-            return html, " ".join(note_parts)
+        return await page.content(), " ".join(note_parts)
+    finally:
+        await context.close()
+
+
+async def _fetch_with_login(url: str, user: str, password: str, wait_ms: int = 1600) -> tuple[str, str]:
+    # logged-in pages differ from anonymous ones, so the account is part of the cache key
+    cache_kind = f"psi:{user}"
+    cached = get_html(url, cache_kind)
+    if cached is not None:
+        return cached, "psi_cache=HIT"
+    try:
+        html, note = await _do_fetch(url, user, password, wait_ms)
     except Exception as e:
         msg = str(e)
-        if "Executable doesn't exist" in msg or "playwright install" in msg:
-            _ensure_playwright_chromium_installed()
-            # retry once
-            async with async_playwright() as pw:
-                browser = await pw.chromium.launch(
-                    headless=True,
-                    args=["--no-sandbox", "--disable-dev-shm-usage", "--disable-blink-features=AutomationControlled"],
-                )
-                context = await browser.new_context(
-                    user_agent=(
-                        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                        "AppleWebKit/537.36 (KHTML, like Gecko) "
-                        "Chrome/122.0.0.0 Safari/537.36"
-                    ),
-                    locale="de-DE",
-                    extra_http_headers={"Accept-Language": "de-DE,de;q=0.9,en-US;q=0.8,en;q=0.7"},
-                    viewport={"width": 1366, "height": 768},
-                )
-                page = await context.new_page()
-                await page.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined});")
-
-                note_parts = ["psi_pw=YES", "psi_retry_install=1"]
-
-                if user and password:
-                    await page.goto(LOGIN_URL, wait_until="domcontentloaded", timeout=60000)
-                    await page.wait_for_timeout(600)
-                    await _accept_cookies_if_any(page)
-                    await page.fill('input[name="username"], input[id*="user" i], input[placeholder*="Benutzername" i], input[type="text"]', user)
-                    await page.fill('input[name="password"], input[id*="pass" i], input[placeholder*="Passwort" i], input[type="password"]', password)
-                    try:
-                        await page.click('button:has-text("LOGIN"), button[type="submit"], input[type="submit"]', timeout=8000)
-                    except Exception:
-                        await page.keyboard.press("Enter")
-                    await page.wait_for_timeout(1200)
-                    await _accept_cookies_if_any(page)
-                    note_parts.append("psi_login=YES")
-                else:
-                    note_parts.append("psi_login=NO")
-
-                await page.goto(url, wait_until="domcontentloaded", timeout=60000)
-                await page.wait_for_timeout(wait_ms)
-                await _auto_scroll(page, steps=10, step_px=900, wait_ms=180)
-                await page.wait_for_timeout(500)
-
-                html = await page.content()
-                await context.close()
-                await browser.close()
-                return html, " ".join(note_parts)
-        raise
+        if "Executable doesn't exist" not in msg and "playwright install" not in msg:
+            raise
+        _ensure_playwright_chromium_installed(force=True)
+        # retry once
+        html, note = await _do_fetch(url, user, password, wait_ms, extra_notes=("psi_retry_install=1",))
+    if "psi_on_login=YES" not in note and not _looks_blocked(html):
+        put_html(url, cache_kind, html)
+    return html, note
 
 
 class PSIProductFinderScraper(Scraper):
+    DOMAINS = ("psiproductfinder.de",)
+
     def can_handle(self, url: str) -> bool:
-        return domain_of(url).endswith("psiproductfinder.de")
+        return domain_of(url).endswith(self.DOMAINS)
 
     def parse(self, url: str) -> ProductDraft:
         domain = domain_of(url)
         user = os.getenv("PSI_USER", "").strip()
         password = os.getenv("PSI_PASS", "").strip()
 
-        html, note = asyncio.run(_fetch_with_login(url, user, password, wait_ms=1700))
-        soup = BeautifulSoup(html, "lxml")
+        html, note = run(_fetch_with_login(url, user, password, wait_ms=1700))
+        root = parse_html(html)
 
-        state = _parse_next_data(soup)
+        state = _parse_next_data(html)
         title = None
         desc = None
 
         if state:
-            title = _find_first(state, {"name", "title", "productName", "product_title"})
-            desc = _find_first(state, {"description", "longDescription", "shortDescription", "productDescription", "text"})
+            found = _find_many(state, _STATE_TARGETS)
+            title, desc = found["title"], found["desc"]
 
         if not title:
-            title = _meta(soup, "og:title") or _meta(soup, "twitter:title") or (clean_text(soup.title.get_text()) if soup.title else "Produs")
+            page_title = css_one(root, "title")
+            title = _meta(root, "og:title") or _meta(root, "twitter:title") or (clean_text(get_text(page_title)) if page_title is not None else "Produs")
 
-        desc_html = ""
         if desc and len(desc) > 80:
-            desc_html = f"<p>{clean_text(desc)}</p>"
+            desc_text = clean_text(desc)
+            desc_html = f"<p>{desc_text}</p>"
         else:
-            desc_html = _best_description_html(soup)
-
-        images = _extract_images(soup, url)
-        abs_imgs = []
-        for u in images:
-            if isinstance(u, str) and u:
-                abs_imgs.append(urljoin(url, u))
-        seen = set()
-        out_imgs = []
-        for u in abs_imgs:
-            if u not in seen:
-                seen.add(u)
-                out_imgs.append(u)
+            desc_html, desc_text = _best_description_html(root)
+
+        # already absolute, de-duplicated and capped at 12
+        images = _extract_images(root, url)
 
         return ProductDraft(
             source_url=url,
@@ -368,8 +421,8 @@ class PSIProductFinderScraper(Scraper):
             sku=ensure_sku(url, None),
             title=title,
             description_html=desc_html,
-            short_description=clean_text(BeautifulSoup(desc_html or "", "lxml").get_text())[:200],
-            images=out_imgs[:12],
+            short_description=short_text(desc_html, desc_text),
+            images=images,
             price=None,
             currency="RON",
             needs_translation=False,
@@ -1,4 +1,5 @@
 from __future__ import annotations
+from functools import lru_cache
 from urllib.parse import urlparse
 from .generic import GenericScraper
 from .promobox import PromoboxScraper
@@ -13,6 +14,8 @@ from .clipperinterall import ClipperInterallScraper
 from .stricker import StrickerScraper
 from .midocean import MidOceanScraper
 
+_GENERIC = GenericScraper()
+
 SCRAPERS = [
     PromoboxScraper(),
     AndAPresentScraper(),
@@ -25,14 +28,28 @@ SCRAPERS = [
     ClipperInterallScraper(),
     StrickerScraper(),
     MidOceanScraper(),
-    GenericScraper(),
+    _GENERIC,
 ]
 
+# host suffix -> scraper; the first scraper claiming a suffix wins, as with the old linear scan
+_SUFFIX_MAP: dict = {}
+for _s in SCRAPERS:
+    for _suffix in _s.DOMAINS:
+        _SUFFIX_MAP.setdefault(_suffix, _s)
+
+@lru_cache(maxsize=1024)
+def _scraper_for_host(host: str):
+    parts = host.split(".")
+    # longest suffix first: shop.pfconcept.com, pfconcept.com, com
+    for i in range(len(parts)):
+        s = _SUFFIX_MAP.get(".".join(parts[i:]))
+        if s is not None:
+            return s
+    return _GENERIC
+
 def get_scraper(url: str):
-    for s in SCRAPERS:
-        try:
-            if s.can_handle(url):
-                return s
-        except Exception:
-            continue
-    return GenericScraper()
+    try:
+        host = urlparse(url).hostname or ""
+    except ValueError:
+        return _GENERIC
+    return _scraper_for_host(host)
@@ -1,34 +1,81 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import hashlib
 import os
 import re
+import time
+from functools import lru_cache
 from urllib.parse import urlparse, quote, urljoin, parse_qs
 
-from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright
+import httpx
 
+from ._parse import attr, css_all, css_one, get_text, loads_json, outer_html, parse_html, short_text
+from ._loop import run
+from ._pw_pool import get_browser
 from .base import Scraper
+from ..browser import _block_heavy
+from ..cache import get_state, put_state
+from ..fetch import get_client
 from ..models import ProductDraft
 from ..utils import clean_text, domain_of, ensure_sku
 
 
-def _meta_content(soup: BeautifulSoup, selectors: list[str]) -> str:
+# parse_html() drops <script> elements, so JSON-LD is read from the raw HTML
+_JSONLD_RE = re.compile(
+    r"""<script\b[^>]*\btype\s*=\s*["']?application/ld\+json["']?[^>]*>(.*?)</script\s*>""",
+    re.IGNORECASE | re.DOTALL,
+)
+
+_TITLE_META = ['meta[property="og:title"]', 'meta[name="twitter:title"]']
+# XDConnects product pages usually carry the name in an H1
+_TITLE_SELECTORS = ("h1", ".page-title", ".product-title", ".product__title", '[data-testid*="title" i]', '[class*="title" i]')
+_DESC_META = ['meta[property="og:description"]', 'meta[name="description"]', 'meta[name="twitter:description"]']
+_DESC_SELECTORS = (".product-description", '[itemprop="description"]', "#description", ".description")
+_COOKIE_BUTTONS = (
+    'button:has-text("Accept")',
+    'button:has-text("I agree")',
+    'button:has-text("Allow all")',
+    'button:has-text("Accept all")',
+    'button:has-text("OK")',
+    'button:has-text("Got it")',
+)
+_COOKIE_BUTTONS_ANY = ", ".join(_COOKIE_BUTTONS)
+
+# login form: accessible label first, attribute guesses as the fallback
+_EMAIL_LABEL_RE = re.compile(r"e-?mail", re.I)
+_EMAIL_INPUTS = 'input[type="email"], input[name*="email" i], input[id*="email" i]'
+_PASS_LABEL_RE = re.compile(r"pass", re.I)
+_PASS_INPUTS = 'input[type="password"], input[name*="pass" i], input[id*="pass" i]'
+_SUBMIT_BUTTONS = 'button[type="submit"], input[type="submit"], button:has-text("Login"), button:has-text("Log in")'
+
+_JUNK_IMG_RE = re.compile(r"logo|icon|sprite", re.I)
+_SLUG_CODE_RE = re.compile(r"[-_]?p\d+\.\d+$", re.I)
+_WS_RE = re.compile(r"\s+")
+_LOCALE_RE = re.compile(r"[a-z]{2}-[a-z]{2}", re.I)
+
+
+def _meta_content(root, selectors: list[str]) -> str:
     for sel in selectors:
-        el = soup.select_one(sel)
-        if el and el.get("content") and clean_text(el.get("content")):
-            return clean_text(el.get("content"))
+        el = css_one(root, sel)
+        c = clean_text(attr(el, "content") or "") if el is not None else ""
+        if c:
+            return c
     return ""
 
 
-def _iter_jsonld_objects(soup: BeautifulSoup):
-    for sc in soup.select('script[type="application/ld+json"]'):
-        raw = (sc.string or sc.get_text() or "").strip()
-        if not raw:
+def _iter_jsonld_objects(html: str):
+    """JSON-LD objects from the blocks that can hold a Product.
+
+    BreadcrumbList / Organization / WebSite blocks are skipped before decoding:
+    a block without the literal "Product" string has no {"@type": "Product"}.
+    """
+    for m in _JSONLD_RE.finditer(html):
+        raw = m.group(1).strip()
+        if '"Product"' not in raw:
             continue
         try:
-            data = json.loads(raw)
+            data = loads_json(raw)
         except Exception:
             continue
         if isinstance(data, dict):
@@ -39,19 +86,26 @@ def _iter_jsonld_objects(soup: BeautifulSoup):
                     yield obj
 
 
-def _find_product_jsonld(soup: BeautifulSoup) -> dict | None:
-    for obj in _iter_jsonld_objects(soup):
-        t = obj.get("@type") or obj.get("type")
-        if t == "Product" or (isinstance(t, list) and "Product" in t):
-            return obj
+_PRODUCT = "Product"
+
+
+def _is_product(t) -> bool:
+    return t == _PRODUCT or (isinstance(t, list) and _PRODUCT in t)
+
+
+def _walk(html: str):
+    """Every JSON-LD object in document order, each followed by its @graph nodes."""
+    for obj in _iter_jsonld_objects(html):
+        yield obj
         graph = obj.get("@graph")
         if isinstance(graph, list):
             for node in graph:
                 if isinstance(node, dict):
-                    nt = node.get("@type")
-                    if nt == "Product" or (isinstance(nt, list) and "Product" in nt):
-                        return node
-    return None
+                    yield node
+
+
+def _find_product_jsonld(html: str) -> dict | None:
+    return next((o for o in _walk(html) if _is_product(o.get("@type") or o.get("type"))), None)
 
 
 def _jsonld_get_images(prod: dict) -> list[str]:
@@ -83,177 +137,356 @@ def _jsonld_get_price(prod: dict) -> float | None:
     return None
 
 
-def _extract_images_dom(soup: BeautifulSoup, base_url: str) -> list[str]:
-    imgs = []
-    for img in soup.select("img"):
-        src = img.get("src") or img.get("data-src") or img.get("data-original")
-        if not src:
+def _extract_images_dom(root, base_url: str) -> list[str]:
+    # dict as an insertion-ordered set; stop as soon as we have 16 distinct URLs
+    seen: dict[str, None] = {}
+    for img in css_all(root, "img"):
+        src = attr(img, "src") or attr(img, "data-src") or attr(img, "data-original")
+        if not src or src.lstrip()[:5].lower() == "data:":
             continue
         src = urljoin(base_url, src)
-        if src.lower().startswith("data:"):
+        if _JUNK_IMG_RE.search(src):
             continue
-        if any(x in src.lower() for x in ["logo", "icon", "sprite"]):
-            continue
-        imgs.append(src)
-    seen = set()
-    out = []
-    for u in imgs:
-        if u not in seen:
-            seen.add(u)
-            out.append(u)
-    return out[:16]
-
-
-def _extract_desc(soup: BeautifulSoup) -> str:
-    ogd = _meta_content(
-        soup,
-        [
-            'meta[property="og:description"]',
-            'meta[name="description"]',
-            'meta[name="twitter:description"]',
-        ],
-    )
+        seen[src] = None
+        if len(seen) == 16:
+            break
+    return list(seen)
+
+
+def _extract_desc(root) -> tuple[str, str]:
+    """(description html, its plain text)."""
+    ogd = _meta_content(root, _DESC_META)
     if ogd and len(ogd) > 40:
-        return f"<p>{ogd}</p>"
-
-    for sel in [
-        ".product-description",
-        '[itemprop="description"]',
-        "#description",
-        ".description",
-    ]:
-        el = soup.select_one(sel)
-        if el and len(el.get_text(strip=True)) > 50:
-            return str(el)
-    return ""
+        return f"<p>{ogd}</p>", ogd
 
+    for sel in _DESC_SELECTORS:
+        el = css_one(root, sel)
+        if el is not None and len(get_text(el, strip=True)) > 50:
+            return outer_html(el), get_text(el)
+    return "", ""
 
-def _title_from_url(url: str) -> str:
-    p = urlparse(url)
-    slug = p.path.rstrip("/").split("/")[-1]
+
+def _title_from_url(url: str, parsed=None) -> str:
+    p = parsed or urlparse(url)
+    return _title_from_path(p.path)
+
+
+# re-runs of the same URL list (and variantId siblings) share a path
+@lru_cache(maxsize=4096)
+def _title_from_path(path: str) -> str:
+    slug = path.rstrip("/").split("/")[-1]
     # remove query variantId etc
-    slug = re.sub(r"[-_]?p\d+\.\d+$", "", slug, flags=re.I)
+    slug = _SLUG_CODE_RE.sub("", slug)
     slug = slug.replace("-", " ").replace("_", " ")
-    slug = re.sub(r"\s+", " ", slug).strip()
+    slug = _WS_RE.sub(" ", slug).strip()
     if not slug:
         return "Produs"
     # Title case but keep acronyms
     return " ".join([w.upper() if w.isupper() and len(w) <= 4 else w.capitalize() for w in slug.split(" ")])
 
 
-async def _auto_scroll(page, steps: int = 10, step_px: int = 900, wait_ms: int = 200):
-    for _ in range(steps):
-        await page.mouse.wheel(0, step_px)
-        await page.wait_for_timeout(wait_ms)
+# <title>, <meta> and JSON-LD only, serialized in the page; far smaller than page.content()
+_HEAD_JS = """() => {
+    const keep = document.querySelectorAll('title, meta, script[type="application/ld+json"]');
+    return '<html><head>' + Array.from(keep, el => el.outerHTML).join('') + '</head><body></body></html>';
+}"""
+
+
+def _head_is_enough(head_html: str) -> bool:
+    """True when the head alone gives the same draft as the full page.
+
+    That is the case when JSON-LD has the Product name and images and the meta
+    description is long enough to be used as is (_extract_desc checks it first).
+    """
+    prod = _find_product_jsonld(head_html)
+    if not prod or not clean_text(str(prod.get("name") or "")) or not _jsonld_get_images(prod):
+        return False
+    return len(_meta_content(parse_html(head_html), _DESC_META)) > 40
+
+
+_SCROLL_JS = "() => { window.scrollTo(0, document.body.scrollHeight); return document.images.length; }"
+
+
+async def _load_lazy_content(page, rounds: int = 3, idle_ms: int = 3000):
+    """Jump to the bottom and wait for the network to settle, until no new <img> appears."""
+    count = -1
+    for _ in range(rounds):
+        n = await page.evaluate(_SCROLL_JS)
+        if n == count:
+            return
+        count = n
+        try:
+            await page.wait_for_load_state("networkidle", timeout=idle_ms)
+        except Exception:
+            pass
+
+
+async def _route(route):
+    # the cookie banner and login form are only clickable once XD's own CSS lays them out,
+    # so first-party stylesheets load; everything else goes through the usual blocking
+    request = route.request
+    if request.resource_type == "stylesheet" and (urlparse(request.url).hostname or "").endswith("xdconnects.com"):
+        await route.continue_()
+    else:
+        await _block_heavy(route)
 
 
 async def _accept_cookies_if_any(page):
-    candidates = [
-        'button:has-text("Accept")',
-        'button:has-text("I agree")',
-        'button:has-text("Allow all")',
-        'button:has-text("Accept all")',
-        'button:has-text("OK")',
-        'button:has-text("Got it")',
-    ]
-    for sel in candidates:
+    # one round trip for the usual case (no banner, or already accepted)
+    try:
+        if await page.locator(_COOKIE_BUTTONS_ANY).count() == 0:
+            return
+    except Exception:
+        return
+    # has-text() is a substring match ("OK" is in "Cookie settings"), so the
+    # candidates are still tried in priority order rather than document order
+    for sel in _COOKIE_BUTTONS:
+        btn = page.locator(sel).first
         try:
-            btn = await page.query_selector(sel)
-            if btn:
-                await btn.click()
+            if await btn.count():
+                await btn.click(timeout=1500)
                 await page.wait_for_timeout(300)
                 return
         except Exception:
             continue
 
 
+# storage_state of a logged-in session, per XD account, so later pages skip the login form
+_STATE: dict[str, dict] = {}
+# ... also kept on disk, so the next run (app restart, next import) starts logged in
+_STATE_TTL = 2 * 3600
+
+
+def _state_name(email: str) -> str:
+    return "xd_state_" + hashlib.sha1(email.encode("utf-8")).hexdigest()[:12]
+
+
+def _load_state(email: str) -> dict | None:
+    if email not in _STATE:
+        state = get_state(_state_name(email), _STATE_TTL)
+        if state is not None:
+            _STATE[email] = state
+    return _STATE.get(email)
+
+
+async def _save_state(context, email: str) -> None:
+    _STATE[email] = state = await context.storage_state()
+    put_state(_state_name(email), state)
+
+
+async def _login(page, email: str, password: str, login_url: str) -> None:
+    await page.goto(login_url, wait_until="domcontentloaded", timeout=60000)
+    await page.wait_for_timeout(700)
+    await _accept_cookies_if_any(page)
+
+    await page.get_by_label(_EMAIL_LABEL_RE).or_(page.locator(_EMAIL_INPUTS)).first.fill(email)
+    await page.get_by_label(_PASS_LABEL_RE).or_(page.locator(_PASS_INPUTS)).first.fill(password)
+
+    try:
+        # returns as soon as the post-login page has loaded, instead of a fixed sleep
+        async with page.expect_navigation(wait_until="domcontentloaded", timeout=15000):
+            try:
+                await page.click(_SUBMIT_BUTTONS, timeout=8000)
+            except Exception:
+                await page.keyboard.press("Enter")
+    except Exception:
+        # no full page load (e.g. the form posts via XHR); the product page goto follows anyway
+        pass
+    await _accept_cookies_if_any(page)
+
+
+_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/122.0.0.0 Safari/537.36"
+)
+_ACCEPT_LANGUAGE = "ro-RO,ro;q=0.9,en-US;q=0.8,en;q=0.7"
+
+
+def _cookie_header(state: dict, host: str) -> str:
+    """Cookie header for host from a Playwright storage_state (unexpired cookies only)."""
+    now = time.time()
+    pairs = []
+    for c in state.get("cookies") or ():
+        domain = (c.get("domain") or "").lstrip(".")
+        if not domain or not (host == domain or host.endswith("." + domain)):
+            continue
+        expires = c.get("expires", -1)
+        if expires is not None and 0 < expires < now:
+            continue
+        pairs.append(f"{c.get('name')}={c.get('value')}")
+    return "; ".join(pairs)
+
+
+async def _fetch_http(url: str, state: dict) -> str | None:
+    """Product page over plain HTTP with the saved session cookies.
+
+    Server-rendered pages carry their Product JSON-LD, so when that comes back
+    Chromium is not needed at all; None means "use the browser" (no session
+    cookies, redirected to login, blocked, or no Product JSON-LD).
+    """
+    cookie = _cookie_header(state, urlparse(url).hostname or "")
+    if not cookie:
+        return None
+    try:
+        r = await get_client().get(
+            url,
+            headers={"User-Agent": _USER_AGENT, "Accept-Language": _ACCEPT_LANGUAGE, "Cookie": cookie},
+            timeout=10,
+        )
+    except httpx.HTTPError:
+        return None
+    if r.status_code != 200 or "/profile/login" in r.url.path:
+        return None
+    html = r.text
+    return html if _find_product_jsonld(html) is not None else None
+
+
 async def _fetch_with_login(url: str, email: str, password: str, wait_ms: int = 1500) -> tuple[str, str]:
     p = urlparse(url)
     locale = "en-gb"
     parts = [x for x in p.path.split("/") if x]
-    if parts and re.fullmatch(r"[a-z]{2}-[a-z]{2}", parts[0], re.IGNORECASE):
+    if parts and _LOCALE_RE.fullmatch(parts[0]):
         locale = parts[0].lower()
 
     login_url = f"https://www.xdconnects.com/{locale}/profile/login?returnurl={quote(p.path)}"
 
-    async with async_playwright() as pw:
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=["--no-sandbox", "--disable-dev-shm-usage", "--disable-blink-features=AutomationControlled"],
-        )
-        context = await browser.new_context(
-            user_agent=(
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/122.0.0.0 Safari/537.36"
-            ),
-            locale="ro-RO",
-            extra_http_headers={"Accept-Language": "ro-RO,ro;q=0.9,en-US;q=0.8,en;q=0.7"},
-            viewport={"width": 1366, "height": 768},
-        )
+    state = _load_state(email)
+    if state is not None:
+        html = await _fetch_http(url, state)
+        if html is not None:
+            return html, f"xd_login=REUSED locale={locale} xd_html=http"
+
+    browser = await get_browser()
+    context = await browser.new_context(
+        user_agent=_USER_AGENT,
+        locale="ro-RO",
+        extra_http_headers={"Accept-Language": _ACCEPT_LANGUAGE},
+        viewport={"width": 1366, "height": 768},
+        storage_state=state,
+    )
+    await context.route("**/*", _route)
+    try:
         page = await context.new_page()
         await page.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined});")
 
-        await page.goto(login_url, wait_until="domcontentloaded", timeout=60000)
-        await page.wait_for_timeout(700)
-        await _accept_cookies_if_any(page)
+        login = "REUSED"
+        if email not in _STATE:
+            await _login(page, email, password, login_url)
+            await _save_state(context, email)
+            login = "YES"
 
-        await page.fill('input[type="email"], input[name*="email" i], input[id*="email" i]', email)
-        await page.fill('input[type="password"], input[name*="pass" i], input[id*="pass" i]', password)
+        await page.goto(url, wait_until="domcontentloaded", timeout=60000)
+        if "/profile/login" in page.url:
+            # saved session expired: log in again and retry the product page
+            await _login(page, email, password, login_url)
+            await _save_state(context, email)
+            login = "RELOGIN"
+            await page.goto(url, wait_until="domcontentloaded", timeout=60000)
 
-        try:
-            await page.click(
-                'button[type="submit"], input[type="submit"], button:has-text("Login"), button:has-text("Log in")',
-                timeout=8000,
-            )
-        except Exception:
-            await page.keyboard.press("Enter")
+        await page.wait_for_timeout(wait_ms)
+        note = f"xd_login={login} locale={locale}"
 
-        await page.wait_for_timeout(1200)
-        await _accept_cookies_if_any(page)
+        # JSON-LD and meta are server-rendered: when they cover the whole draft,
+        # skip the lazy-load scrolling and the full DOM serialization
+        head = await page.evaluate(_HEAD_JS)
+        if _head_is_enough(head):
+            return head, f"{note} xd_html=head"
 
-        await page.goto(url, wait_until="domcontentloaded", timeout=60000)
-        await page.wait_for_timeout(wait_ms)
-        await _auto_scroll(page, steps=12, step_px=900, wait_ms=200)
-        await page.wait_for_timeout(600)
+        await _load_lazy_content(page)
 
         html = await page.content()
+        return html, note
+    finally:
         await context.close()
-        await browser.close()
-        return html, f"xd_login=YES locale={locale}"
 
 
 class XDConnectsScraper(Scraper):
+    DOMAINS = ("xdconnects.com",)
+
     def can_handle(self, url: str) -> bool:
-        return domain_of(url).endswith("xdconnects.com")
+        return domain_of(url).endswith(self.DOMAINS)
 
-    def parse(self, url: str) -> ProductDraft:
-        email = os.getenv("XD_USER", "").strip()
-        password = os.getenv("XD_PASS", "").strip()
+    @staticmethod
+    def _creds() -> tuple[str, str]:
+        return os.getenv("XD_USER", "").strip(), os.getenv("XD_PASS", "").strip()
 
+    @staticmethod
+    def _missing_creds(url: str) -> ProductDraft:
+        return ProductDraft(
+            source_url=url,
+            domain=domain_of(url),
+            sku=ensure_sku(url, None),
+            title="(XDConnects) Lipsesc credențialele",
+            description_html="<p>Completează XD_USER / XD_PASS în Streamlit Secrets.</p>",
+            short_description="Completează XD_USER / XD_PASS în Streamlit Secrets.",
+            images=[],
+            price=None,
+            currency="RON",
+            needs_translation=False,
+            notes="xd_login=NO (missing creds)",
+        )
+
+    def parse(self, url: str) -> ProductDraft:
+        email, password = self._creds()
         if not email or not password:
-            return ProductDraft(
-                source_url=url,
-                domain=domain_of(url),
-                sku=ensure_sku(url, None),
-                title="(XDConnects) Lipsesc credențialele",
-                description_html="<p>Completează XD_USER / XD_PASS în Streamlit Secrets.</p>",
-                short_description="Completează XD_USER / XD_PASS în Streamlit Secrets.",
-                images=[],
-                price=None,
-                currency="RON",
-                needs_translation=False,
-                notes="xd_login=NO (missing creds)",
-            )
+            return self._missing_creds(url)
 
-        html, login_note = asyncio.run(_fetch_with_login(url, email, password, wait_ms=1600))
-        soup = BeautifulSoup(html, "lxml")
+        html, login_note = run(_fetch_with_login(url, email, password, wait_ms=1600))
+        return self._draft(url, html, login_note)
 
-        page_title = clean_text(soup.title.get_text()) if soup.title else ""
+    async def parse_async(self, url: str) -> ProductDraft:
+        """parse() for callers already running an event loop (uses that loop's pooled browser)."""
+        email, password = self._creds()
+        if not email or not password:
+            return self._missing_creds(url)
+
+        html, login_note = await _fetch_with_login(url, email, password, wait_ms=1600)
+        return self._draft(url, html, login_note)
+
+    def parse_batch(self, urls: list[str], concurrency: int = 8) -> list:
+        """parse() for many URLs on the shared scraper loop, at most `concurrency` pages at a time.
+
+        Each item is a ProductDraft, or the exception raised for that URL.
+        """
+        return run(self._parse_batch(urls, concurrency))
+
+    async def _parse_batch(self, urls: list[str], concurrency: int) -> list:
+        sem = asyncio.Semaphore(concurrency)
+
+        async def one(url: str) -> ProductDraft:
+            async with sem:
+                return await self.parse_async(url)
+
+        results: list = []
+        rest = urls
+        email = self._creds()[0]
+        if urls and email and _load_state(email) is None:
+            # log in once on the first page; the others then start from its storage_state
+            results = await asyncio.gather(one(urls[0]), return_exceptions=True)
+            rest = urls[1:]
+        results += await asyncio.gather(*[one(u) for u in rest], return_exceptions=True)
+        return results
+
+    def _draft(self, url: str, html: str, login_note: str) -> ProductDraft:
+        # _fetch_with_login notes where the HTML came from: the HTTP fast path, the head-only
+        # page evaluation, or the full rendered page
+        if "xd_html=http" in login_note:
+            parsed_with = "httpx"
+        elif "xd_html=head" in login_note:
+            parsed_with = "playwright_head"
+        else:
+            parsed_with = "playwright"
+        parsed = urlparse(url)
+        domain = parsed.netloc.lower()
+        root = parse_html(html)
+
+        title_el = css_one(root, "title")
+        page_title = clean_text(get_text(title_el)) if title_el is not None else ""
         if "403" in page_title.lower() or "access not allowed" in page_title.lower():
             return ProductDraft(
                 source_url=url,
-                domain=domain_of(url),
+                domain=domain,
                 sku=ensure_sku(url, None),
                 title=page_title or "Error 403",
                 description_html="<p>XDConnects blochează accesul (403). Chiar și după login. Poate fi blocare pe IP/datacenter.</p>",
@@ -262,10 +495,10 @@ class XDConnectsScraper(Scraper):
                 price=None,
                 currency="RON",
                 needs_translation=False,
-                notes=f"parsed_with=playwright | {login_note} | blocked=403",
+                notes=f"parsed_with={parsed_with} | {login_note} | blocked=403",
             )
 
-        prod = _find_product_jsonld(soup)
+        prod = _find_product_jsonld(html)
 
         title = None
         sku = None
@@ -280,36 +513,40 @@ class XDConnectsScraper(Scraper):
 
         # Strong DOM fallbacks for title (XDConnects often has H1)
         if not title:
-            title = (
-                _meta_content(soup, ['meta[property="og:title"]', 'meta[name="twitter:title"]'])
-                or clean_text((soup.select_one("h1") or soup.select_one(".page-title") or soup.select_one(".product-title") or soup.select_one(".product__title") or soup.select_one('[data-testid*="title" i]') or soup.select_one('[class*="title" i]')).get_text())
-                if (soup.select_one("h1") or soup.select_one(".page-title") or soup.select_one(".product-title") or soup.select_one(".product__title") or soup.select_one('[data-testid*="title" i]') or soup.select_one('[class*="title" i]')) else None
-            )
+            title = _meta_content(root, _TITLE_META)
+        if not title:
+            for sel in _TITLE_SELECTORS:
+                el = css_one(root, sel)
+                if el is not None:
+                    title = clean_text(get_text(el))
+                    if title:
+                        break
 
         if not title:
-            title = _title_from_url(url)
+            title = _title_from_url(url, parsed)
 
-        desc_html = _extract_desc(soup) or "<p></p>"
+        desc_html, desc_text = _extract_desc(root)
+        desc_html = desc_html or "<p></p>"
 
         if not images:
-            images = _extract_images_dom(soup, url)
+            images = _extract_images_dom(root, url)
 
         # Extra hint: variantId from query (optional)
-        q = parse_qs(urlparse(url).query)
+        q = parse_qs(parsed.query)
         variant = q.get("variantId", [""])[0]
 
         notes_extra = f"variantId={variant}" if variant else ""
 
         return ProductDraft(
             source_url=url,
-            domain=domain_of(url),
+            domain=domain,
             sku=ensure_sku(url, sku),
             title=title,
             description_html=desc_html,
-            short_description=clean_text(BeautifulSoup(desc_html, "lxml").get_text())[:200],
+            short_description=short_text(desc_html, desc_text),
             images=images,
             price=price,
             currency="RON",
             needs_translation=False,
-            notes=f"parsed_with=playwright | {login_note} | xd_scraper=v1.2 | {notes_extra}".strip(),
+            notes=f"parsed_with={parsed_with} | {login_note} | xd_scraper=v1.2 | {notes_extra}".strip(),
         )
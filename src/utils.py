@@ -1,7 +1,6 @@
 from __future__ import annotations
 import re
 from urllib.parse import urlparse
-from slugify import slugify
 
 def detect_url_column(columns):
     # case-insensitive match
@@ -18,16 +17,29 @@ def detect_url_column(columns):
 def domain_of(url: str) -> str:
     return urlparse(url).netloc.lower()
 
+# Plain URL characters (unreserved + ":"), for which python-slugify reduces to
+# "lowercase, runs of anything else -> '-'". Commas, quotes, entities, %-escapes
+# and non-ASCII need its full rules (transliteration via unidecode).
+_SLUG_SAFE_RE = re.compile(r"[A-Za-z0-9._~:-]*")
+_SLUG_SEP_RE = re.compile(r"[^a-z0-9]+")
+
 def ensure_sku(url: str, sku: str | None) -> str:
     if sku and str(sku).strip():
         return str(sku).strip()
     # fallback generated
     p = urlparse(url)
     tail = (p.path.strip("/").split("/")[-1] or "produs")
-    return slugify(f"{p.netloc}-{tail}")[:64]
+    raw = f"{p.netloc}-{tail}"
+    if _SLUG_SAFE_RE.fullmatch(raw):
+        return _SLUG_SEP_RE.sub("-", raw.lower()).strip("-")[:64]
+    from slugify import slugify  # only needed (and imported) for the unusual URLs
+
+    return slugify(raw)[:64]
+
+_WS_RE = re.compile(r"\s+")
 
 def clean_text(s: str) -> str:
     if not s:
         return ""
-    s = re.sub(r"\s+", " ", s).strip()
+    s = _WS_RE.sub(" ", s).strip()
     return s